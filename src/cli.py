@@ -43,21 +43,25 @@ async def run_scraper(scraper: BaseScraper) -> ScrapeResult | None:
 
 
 async def run_all_parallel(scrapers: list[BaseScraper], db: ProductDatabase) -> None:
-    """Run all scrapers in parallel using TaskGroup."""
+    """Run all scrapers in parallel; one failing scraper does not cancel the others."""
     print(f"Running {len(scrapers)} scraper(s) in parallel...")
     start = time.perf_counter()
 
     try:
-        async with asyncio.TaskGroup() as tg:
-            tasks = [tg.create_task(run_scraper(s)) for s in scrapers]
+        # Browser-backed scrapers are throttled by the pool's context limit.
+        results = await asyncio.gather(*(run_scraper(s) for s in scrapers), return_exceptions=True)
 
         # Save results to database
-        for task in tasks:
-            if (result := task.result()) and result.products:
+        for scraper, result in zip(scrapers, results):
+            if isinstance(result, BaseException):
+                print(f"[{scraper.name}] Failed: {result!r}", file=sys.stderr)
+            elif result and result.products:
                 db.save_results(result)
     finally:
         from .scrapers.browser_pool import BrowserPool
+        from .scrapers.http_client import close_shared_client
         await BrowserPool.shutdown()
+        await close_shared_client()
 
     elapsed = time.perf_counter() - start
     print(f"\nAll scrapers completed in {elapsed:.2f}s")
@@ -209,6 +213,7 @@ def main() -> int:
         epilog="""
 Examples:
   python -m src.cli --source bergzeit    # Run single source
+  python -m src.cli -s bike24 --no-cache # Run without the on-disk listing cache
   python -m src.cli --all                # Run all sources in parallel
   python -m src.cli --list               # List available sources
   python -m src.cli --worker             # Run the job queue worker
@@ -224,9 +229,18 @@ Examples:
     group.add_argument("--worker", "-w", action="store_true", help="Run the job queue worker")
     group.add_argument("--enqueue", "-e", help="Enqueue a scraper job")
     group.add_argument("--serve", action="store_true", help="Run webserver and worker together (restarts on crash)")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk cache for remote listing responses",
+    )
 
     args = parser.parse_args()
 
+    if args.no_cache:
+        # Environment variable so spawned worker processes inherit the setting.
+        os.environ["CORASTUFF_NO_CACHE"] = "1"
+
     if args.list:
         print("Available scrapers:")
         for name in list_scrapers():
@@ -268,11 +282,13 @@ Examples:
 
             async def run_single():
                 from .scrapers.browser_pool import BrowserPool
+                from .scrapers.http_client import close_shared_client
                 try:
                     if result := await run_scraper(scraper):
                         db.save_results(result)
                 finally:
                     await BrowserPool.shutdown()
+                    await close_shared_client()
 
             asyncio.run(run_single())
         except ValueError as e:
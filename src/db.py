@@ -248,6 +248,8 @@ class ProductDatabase:
         """Save scrape results to the database (append mode for history)."""
         scraped_at = result.scraped_at.isoformat()
 
+        # Variants often carry byte-identical images; re-encode each distinct image once.
+        processed_images: dict[str, tuple[bytes, str]] = {}
         with sqlite3.connect(self.db_path) as conn:
             for product in result.products:
                 product_key = self._build_product_key(product)
@@ -268,7 +270,7 @@ class ProductDatabase:
                         product_key_db,
                     ),
                 )
-                self._upsert_product_image(conn, result.source, product, product_key)
+                self._upsert_product_image(conn, result.source, product, product_key, processed_images)
             conn.commit()
 
         print(f"[db] Saved {len(result.products)} products from '{result.source}' to {self.db_path}")
@@ -2333,8 +2335,18 @@ class ProductDatabase:
             print(f"[db] Failed to process image, storing original: {exc}")
             return image_bytes, mime_type or "image/jpeg"
 
-    def _upsert_product_image(self, conn: sqlite3.Connection, source: str, product: Product, product_key: str) -> None:
-        """Store or update the latest image for a product if provided."""
+    def _upsert_product_image(
+        self,
+        conn: sqlite3.Connection,
+        source: str,
+        product: Product,
+        product_key: str,
+        processed_images: dict[str, tuple[bytes, str]] | None = None,
+    ) -> None:
+        """Store or update the latest image for a product if provided.
+
+        `processed_images` memoizes `_process_image` output by the SHA-256 of the raw bytes.
+        """
         if not product.image or not product_key:
             return
 
@@ -2348,7 +2360,13 @@ class ProductDatabase:
         mime_type = product.image_mime or "image/jpeg"
 
         # Convert and downsize before hashing/storing
-        image_bytes, mime_type = self._process_image(image_bytes, mime_type)
+        if processed_images is None:
+            image_bytes, mime_type = self._process_image(image_bytes, mime_type)
+        else:
+            raw_hash = hashlib.sha256(image_bytes).hexdigest()
+            if (cached := processed_images.get(raw_hash)) is None:
+                cached = processed_images[raw_hash] = self._process_image(image_bytes, mime_type)
+            image_bytes, mime_type = cached
         image_hash = hashlib.sha256(image_bytes).hexdigest()
         now = datetime.utcnow().isoformat()
 
@@ -33,7 +33,7 @@ def _discover_scrapers() -> dict[str, type[BaseScraper]]:
         if module_info.ispkg:
             continue
         module_name = module_info.name
-        if module_name.startswith("_") or module_name in {"base", "browser_pool"}:
+        if module_name.startswith("_") or module_name in {"base", "browser_pool", "http_cache", "http_client", "image_cache", "urlutils"}:
             continue
 
         full_name = f"{__name__}.{module_name}"
@@ -13,12 +13,13 @@ import html as htmllib
 from datetime import datetime, UTC
 from urllib.parse import urljoin
 
-from playwright.async_api import Page, BrowserContext, async_playwright
+from playwright.async_api import Page, BrowserContext
 from playwright_stealth import Stealth
 
 from ..models import Product, ScrapeResult
 from ..utils import parse_price
 from .base import BaseScraper
+from .browser_pool import get_browser_context
 
 AMAZON_BASE = "https://www.amazon.de"
 
@@ -30,6 +31,21 @@ COOKIE_SELECTORS = [
     'button:has-text("Zustimmen")',
 ]
 
+AMAZON_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+)
+
+
+def _amazon_context():
+    """Shared-pool context for Amazon (full desktop viewport, no resource blocking)."""
+    return get_browser_context(
+        user_agent=AMAZON_USER_AGENT,
+        locale="de-DE",
+        viewport={"width": 1920, "height": 1080},
+        block_resources=None,
+    )
+
 DETAIL_PRICE_SELECTORS = [
     "#corePrice_feature_div .a-price .a-offscreen",
     "#corePriceDisplay_desktop_feature_div .a-price .a-offscreen",
@@ -55,22 +71,7 @@ class AmazonDEScraper(BaseScraper):
 
     async def scrape(self) -> ScrapeResult:
         """Run the scraper with Amazon-specific handling."""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-sandbox",
-                ],
-            )
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                locale="de-DE",
-                user_agent=(
-                    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                    "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-                ),
-            )
+        async with _amazon_context() as context:
             page = await context.new_page()
             stealth = Stealth()
             await stealth.apply_stealth_async(page)
@@ -87,7 +88,6 @@ class AmazonDEScraper(BaseScraper):
             lowered = content.lower()
             if "robot check" in content or "captcha" in lowered or "geben sie die zeichen" in lowered:
                 print(f"[{self.name}] Blocked by Amazon (captcha/robot check).")
-                await browser.close()
                 return ScrapeResult(
                     source=self.name,
                     source_url=self.url,
@@ -139,8 +139,6 @@ class AmazonDEScraper(BaseScraper):
                     f"[{self.name}] Enriched prices for {len(missing_prices)} missing product(s)"
                 )
 
-            await browser.close()
-
         return ScrapeResult(
             source=self.name,
             source_url=self.url,
@@ -534,22 +532,7 @@ async def scrape_amazon_listing(asin: str, url: str | None = None) -> Product |
 
     listing_url = url or f"{AMAZON_BASE}/dp/{asin_clean}"
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-            ],
-        )
-        context = await browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            locale="de-DE",
-            user_agent=(
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-            ),
-        )
+    async with _amazon_context() as context:
         page = await context.new_page()
         stealth = Stealth()
         await stealth.apply_stealth_async(page)
@@ -557,7 +540,6 @@ async def scrape_amazon_listing(asin: str, url: str | None = None) -> Product |
         try:
             await page.goto(listing_url, wait_until="domcontentloaded", timeout=90000)
         except Exception:
-            await browser.close()
             return None
 
         # Cookie banner
@@ -574,7 +556,6 @@ async def scrape_amazon_listing(asin: str, url: str | None = None) -> Product |
         content = await page.content()
         lowered = content.lower()
         if "robot check" in content or "captcha" in lowered or "geben sie die zeichen" in lowered:
-            await browser.close()
             return None
 
         name = None
@@ -635,8 +616,6 @@ async def scrape_amazon_listing(asin: str, url: str | None = None) -> Product |
             except Exception:
                 pass
 
-        await browser.close()
-
     if not name:
         name = asin_clean
 
@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
-import json
 import re
 from datetime import UTC, datetime
-from urllib.parse import parse_qs, urljoin, urlparse
 
+import orjson
 from playwright.async_api import Page
 
 from ..models import Product, ScrapeResult
 from ..utils import parse_price
 from .base import BaseScraper
 from .browser_pool import get_browser_context
+from .image_cache import cached_fetch
+from .urlutils import normalize
+
+_VARIANT_RE = re.compile(r"[?&]variant=(\d{6,})")
 
 
 class ArtztScraper(BaseScraper):
@@ -22,6 +25,8 @@ class ArtztScraper(BaseScraper):
     display_name = "ARTZT"
     url = "https://artzt.eu/en/products/blackroll-standard"
 
+    _base_url = "https://artzt.eu/"
+
     async def scrape(self) -> ScrapeResult:
         async with get_browser_context() as context:
             page = await context.new_page()
@@ -64,15 +69,7 @@ class ArtztScraper(BaseScraper):
     def _extract_variant_id(url: str | None) -> str | None:
         if not url:
             return None
-        try:
-            parsed = urlparse(url)
-            params = parse_qs(parsed.query)
-            v = params.get("variant", [None])[0]
-            if isinstance(v, str) and re.fullmatch(r"\d{6,}", v):
-                return v
-        except Exception:
-            pass
-        if match := re.search(r"[?&]variant=(\d{6,})", url):
+        if match := _VARIANT_RE.search(url):
             return match.group(1)
         return None
 
@@ -92,18 +89,18 @@ class ArtztScraper(BaseScraper):
         return None
 
     async def _fetch_image(self, page: Page, image_url: str | None) -> tuple[bytes | None, str | None]:
+        image_url = normalize(image_url, base=self._base_url)
         if not image_url:
             return None, None
 
-        if image_url.startswith("//"):
-            image_url = f"https:{image_url}"
-        elif image_url.startswith("/"):
-            image_url = urljoin("https://artzt.eu/", image_url)
-
         try:
             resp = await page.context.request.get(image_url, timeout=30000)
             if not resp.ok:
                 return None, None
+            # Placeholders are tiny; skip transferring the body when the header already says so.
+            content_length = resp.headers.get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) < 800:
+                return None, None
             body = await resp.body()
             if len(body) < 800:
                 return None, None
@@ -147,9 +144,10 @@ class ArtztScraper(BaseScraper):
         for script in scripts:
             try:
                 raw = (await script.inner_text() or "").strip()
-                if not raw:
+                # Cheap textual prefilter: skip Organization/BreadcrumbList/etc. blocks unparsed.
+                if '"@type"' not in raw or "Product" not in raw:
                     continue
-                data = json.loads(raw)
+                data = orjson.loads(raw)
             except Exception:
                 continue
 
@@ -215,10 +213,9 @@ class ArtztScraper(BaseScraper):
                     image_url = await og_img2.get_attribute("content")
             image_url = image_url.strip() if isinstance(image_url, str) and image_url.strip() else None
 
-        if url:
-            url = urljoin("https://artzt.eu/", url)
+        url = normalize(url, base=self._base_url)
 
-        image_bytes, image_mime = await self._fetch_image(page, image_url)
+        image_bytes, image_mime = await cached_fetch(image_url, lambda u: self._fetch_image(page, u))
 
         if not name or not url:
             return []
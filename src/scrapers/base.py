@@ -1,14 +1,101 @@
 """Base scraper class for all sources."""
 
-import json
+import csv
 from abc import ABC, abstractmethod
 from datetime import datetime, UTC
 from pathlib import Path
+from typing import Callable, Mapping
 
-from playwright.async_api import Page
+import httpx
+import orjson
+from playwright.async_api import Frame, Page
 
 from ..models import Product, ScrapeResult
-from .browser_pool import get_browser_context
+from .browser_pool import DEFAULT_BLOCKED_RESOURCES, get_browser_context
+from .image_cache import ImageFetcher, fetch_images
+
+
+def _json_default(obj: object) -> object:
+    # Raw image bytes are intentionally not exported (mirrors `Product.to_dict`).
+    if isinstance(obj, (bytes, bytearray)):
+        return None
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Resolves the first visible match for a list of selectors inside the page. Supports
+# plain CSS plus Playwright's `tag:has-text("...")` (case-insensitive substring).
+_FIND_FIRST_VISIBLE_JS = """
+(selectors) => {
+  const visible = el => {
+    const r = el.getBoundingClientRect();
+    return r.width > 0 && r.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+  };
+  for (const sel of selectors) {
+    const m = sel.match(/^(.*):has-text\\("(.*)"\\)$/);
+    let els;
+    try {
+      els = Array.from(document.querySelectorAll(m ? (m[1] || '*') : sel));
+    } catch (e) {
+      continue;
+    }
+    if (m) {
+      const needle = m[2].toLowerCase();
+      els = els.filter(el => (el.textContent || '').toLowerCase().includes(needle));
+    }
+    if (els.length && visible(els[0])) return sel;
+  }
+  return null;
+}
+"""
+
+
+# Selector that last matched per `remember_as` key (e.g. a scraper's consent button),
+# tried first on later calls since a site's banner rarely changes.
+_FIRST_VISIBLE_HITS: dict[str, str] = {}
+
+
+async def click_first_visible(
+    page: Page | Frame, selectors: tuple[str, ...], *, remember_as: str | None = None
+) -> bool:
+    """Click the first selector whose first match is visible; returns whether anything was clicked.
+
+    All selectors are checked in a single `evaluate` instead of one round-trip each.
+    """
+    if remember_as and (hit := _FIRST_VISIBLE_HITS.get(remember_as)) in selectors:
+        selectors = (hit, *(s for s in selectors if s != hit))
+    try:
+        selector = await page.evaluate(_FIND_FIRST_VISIBLE_JS, list(selectors))
+        if not selector:
+            return False
+        await page.locator(selector).first.click()
+    except Exception:
+        return False
+    if remember_as:
+        _FIRST_VISIBLE_HITS[remember_as] = selector
+    return True
+
+
+_SCROLL_THROUGH_JS = """
+async ({step, pauseMs}) => {
+  for (let y = 0; y < document.body.scrollHeight; y += step) {
+    window.scrollTo(0, y);
+    await new Promise(r => setTimeout(r, pauseMs));
+  }
+  window.scrollTo(0, 0);
+}
+"""
+
+
+async def scroll_through(page: Page, *, step: int = 800, pause_ms: int = 40, settle_ms: int = 600) -> None:
+    """Scroll the whole page once in a single `evaluate` so lazy-loaded images get their src.
+
+    Replaces scrolling each tile into view with its own round-trip and sleep.
+    """
+    try:
+        await page.evaluate(_SCROLL_THROUGH_JS, {"step": step, "pauseMs": pause_ms})
+    except Exception:
+        return
+    await page.wait_for_timeout(settle_ms)
 
 
 class BaseScraper(ABC):
@@ -22,6 +109,12 @@ class BaseScraper(ABC):
     locale: str | None = None
     viewport: dict[str, int] | None = None
     init_scripts: list[str] | None = None
+    # Playwright resource types aborted for this scraper's pages; None disables blocking.
+    block_resources: frozenset[str] | None = DEFAULT_BLOCKED_RESOURCES
+    # Navigation readiness for the default `scrape()`: avoid "networkidle", which
+    # trackers can delay indefinitely, and wait for a concrete selector instead.
+    wait_until: str = "domcontentloaded"
+    ready_selector: str | None = None
 
     def __init__(self, output_dir: Path | None = None):
         self.output_dir = output_dir or Path(__file__).parent.parent.parent / "output"
@@ -39,11 +132,14 @@ class BaseScraper(ABC):
             locale=self.locale,
             viewport=self.viewport,
             init_scripts=self.init_scripts,
+            block_resources=self.block_resources,
         ) as context:
             page = await context.new_page()
 
             print(f"[{self.name}] Loading {self.url}...")
-            await page.goto(self.url, wait_until="networkidle")
+            await page.goto(self.url, wait_until=self.wait_until)
+            if self.ready_selector:
+                await page.wait_for_selector(self.ready_selector)
 
             products = await self.extract_products(page)
             print(f"[{self.name}] Extracted {len(products)} products")
@@ -55,24 +151,93 @@ class BaseScraper(ABC):
             products=products,
         )
 
+    def parse_rows(self, rows: list[dict], parse_row: Callable[[dict], dict | None]) -> list[dict]:
+        """Apply `parse_row` to every raw tile, dropping None results.
+
+        Failures are summarised in one line per run instead of one per tile.
+        """
+        parsed: list[dict] = []
+        errors: list[tuple[int, str]] = []
+        for idx, row in enumerate(rows):
+            try:
+                if (entry := parse_row(row)) is not None:
+                    parsed.append(entry)
+            except Exception as e:
+                errors.append((idx, str(e)))
+        if errors:
+            print(f"[{self.name}] {len(errors)} product(s) failed to parse, e.g. {errors[:3]}")
+        return parsed
+
+    async def build_products(
+        self,
+        client: httpx.AsyncClient | None,
+        entries: list[dict],
+        *,
+        headers: Mapping[str, str] | None = None,
+        fetcher: ImageFetcher | None = None,
+    ) -> list[Product]:
+        """Turn parsed entries (Product fields plus `image_url`) into Products.
+
+        Images are downloaded concurrently once all tiles have been read, with `headers`
+        (default: just a Referer to the listing) on every image request. A `fetcher`
+        replaces the download through `client`, e.g. to go through the browser instead.
+        """
+        images = await fetch_images(
+            client,
+            [e["image_url"] for e in entries],
+            headers=headers or {"Referer": self.url},
+            fetcher=fetcher,
+        )
+        products = [
+            Product(
+                name=entry["name"],
+                price=entry["price"],
+                currency=entry["currency"],
+                url=entry["url"],
+                item_id=entry["item_id"],
+                image=image_bytes,
+                image_mime=image_mime,
+            )
+            for entry, (image_bytes, image_mime) in zip(entries, images)
+        ]
+        missing = sum(1 for entry, product in zip(entries, products) if entry["image_url"] and not product.image)
+        if missing:
+            print(f"[{self.name}] {missing} image(s) could not be downloaded")
+        return products
+
     def save_results(self, result: ScrapeResult) -> tuple[Path, Path]:
         """Save results to JSON and CSV files."""
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         json_file = self.output_dir / f"{self.name}_products.json"
-        json_file.write_text(
-            json.dumps(result.to_dict(), ensure_ascii=False, indent=2),
-            encoding="utf-8",
+        # Same shape as `result.to_dict()`, but orjson serializes the Product dataclasses
+        # and datetime natively instead of building an intermediate dict per product.
+        payload = {
+            "source": result.source,
+            "source_url": result.source_url,
+            "scraped_at": result.scraped_at,
+            "total_products": len(result.products),
+            "products": result.products,
+        }
+        json_file.write_bytes(
+            orjson.dumps(payload, default=_json_default, option=orjson.OPT_INDENT_2)
         )
         print(f"[{self.name}] Saved JSON to {json_file}")
 
         csv_file = self.output_dir / f"{self.name}_products.csv"
-        lines = ["name,price,currency,url,item_id"]
-        for p in result.products:
-            name = (p.name or "").replace('"', '""')
-            price = p.price if p.price is not None else ""
-            lines.append(f'"{name}",{price},"{p.currency or ""}","{p.url or ""}","{p.item_id or ""}"')
-        csv_file.write_text("\n".join(lines), encoding="utf-8")
+        with csv_file.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(["name", "price", "currency", "url", "item_id"])
+            writer.writerows(
+                (
+                    p.name or "",
+                    p.price if p.price is not None else "",
+                    p.currency or "",
+                    p.url or "",
+                    p.item_id or "",
+                )
+                for p in result.products
+            )
         print(f"[{self.name}] Saved CSV to {csv_file}")
 
         return json_file, csv_file
@@ -1,10 +1,22 @@
 """Scraper for Bergzeit.de Blackroll products."""
 
+import lxml.html
+from lxml import etree
 from playwright.async_api import Page
 
 from ..models import Product
 from ..utils import parse_price
 from .base import BaseScraper
+from .urlutils import normalize
+
+
+def _class_xpath(class_name: str) -> str:
+    """XPath step matching descendants carrying `class_name` (CSS `.class_name`)."""
+    return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+def _text(el: lxml.html.HtmlElement) -> str:
+    return " ".join(el.text_content().split())
 
 
 class BergzeitScraper(BaseScraper):
@@ -13,88 +25,131 @@ class BergzeitScraper(BaseScraper):
     name = "bergzeit"
     display_name = "Bergzeit"
     url = "https://www.bergzeit.de/marken/blackroll/"
+    ready_selector = ".product-box"
+
+    _base_url = "https://www.bergzeit.de"
+
+    # Selectors are compiled once; the per-tile ones are evaluated relative to the tile.
+    _COUNTER_XPATH = etree.XPath(_class_xpath("products-list-page-header__headline-counter"))
+    _BOX_XPATH = etree.XPath(_class_xpath("product-box"))
+    _NAME_XPATH = etree.XPath("." + _class_xpath("product-box-content__name"))
+    _PRICE_XPATH = etree.XPath("." + _class_xpath("product-box-content__price"))
+    _IMG_XPATH = etree.XPath("." + _class_xpath("product-box__image-container") + "//img")
+
+    async def _fetch_image(self, page: Page, image_url: str | None) -> tuple[bytes | None, str | None]:
+        image_url = normalize(image_url, base=self._base_url)
+        if not image_url:
+            return None, None
+
+        try:
+            response = await page.context.request.get(image_url)
+            if not response.ok:
+                return None, None
+            image_bytes = await response.body()
+            image_mime = response.headers.get("content-type")
+            if image_mime and ";" in image_mime:
+                image_mime = image_mime.split(";", 1)[0].strip()
+            return image_bytes, image_mime
+        except Exception as img_err:
+            print(f"[{self.name}] Failed to fetch image {image_url}: {img_err}")
+            return None, None
+
+    @classmethod
+    def _parse_product_boxes(cls, tree: lxml.html.HtmlElement) -> list[dict]:
+        """Read name/price/link/id/image for every product tile from the rendered HTML."""
+        items: list[dict] = []
+        for box in cls._BOX_XPATH(tree):
+            name_els = cls._NAME_XPATH(box)
+            price_els = cls._PRICE_XPATH(box)
+            imgs = cls._IMG_XPATH(box)
+            image_url = None
+            if imgs:
+                img = imgs[0]
+                image_url = (
+                    img.get("src")
+                    or img.get("data-src")
+                    or img.get("data-srcset")
+                    or img.get("srcset")
+                )
+            items.append(
+                {
+                    "name": _text(name_els[0]) if name_els else None,
+                    "priceText": _text(price_els[0]) if price_els else None,
+                    "url": box.get("href"),
+                    "itemId": box.get("data-item-id"),
+                    "imageUrl": image_url or None,
+                }
+            )
+        return items
+
+    async def _load_lazy_images(self, page: Page) -> None:
+        """Trigger lazy loading for all tiles in one in-page pass and wait for real image sources."""
+        # Yield a frame per tile: lazy loaders (IntersectionObserver) only see scroll
+        # positions that survive to a rendering update, not a synchronous loop.
+        await page.evaluate(
+            """
+            async () => {
+              const frame = () => new Promise(resolve => requestAnimationFrame(() => resolve()));
+              for (const el of document.querySelectorAll('.product-box')) {
+                el.scrollIntoView({ block: 'center' });
+                await frame();
+              }
+              window.scrollTo(0, document.body.scrollHeight);
+              await frame();
+            }
+            """
+        )
+        try:
+            await page.wait_for_function(
+                """() => Array.from(document.querySelectorAll('.product-box__image-container img'))
+                    .every(e => e.currentSrc && !e.currentSrc.startsWith('data:'))""",
+                timeout=10000,
+            )
+        except Exception:
+            print(f"[{self.name}] Timed out waiting for lazy images; using what has loaded")
 
     async def extract_products(self, page: Page) -> list[Product]:
         """Extract all Blackroll products from the page."""
-        products: list[Product] = []
-
         await page.wait_for_selector(".product-box", timeout=10000)
-        await page.wait_for_timeout(2000)
-        await page.wait_for_selector(".product-box__image-container img", timeout=10000)
+        await page.wait_for_selector(".product-box__image-container img", timeout=10000, state="attached")
+
+        await self._load_lazy_images(page)
 
-        if count_el := await page.query_selector(".products-list-page-header__headline-counter"):
-            total_text = await count_el.inner_text()
-            print(f"[{self.name}] Total products on page: {total_text}")
+        tree = lxml.html.fromstring(await page.content())
+        if counters := self._COUNTER_XPATH(tree):
+            print(f"[{self.name}] Total products on page: {_text(counters[0])}")
 
-        product_elements = await page.query_selector_all(".product-box")
-        print(f"[{self.name}] Found {len(product_elements)} product elements")
+        items = self._parse_product_boxes(tree)
+        print(f"[{self.name}] Found {len(items)} product elements")
 
-        for idx, product in enumerate(product_elements):
+        parsed: list[dict] = []
+        for idx, raw in enumerate(items):
             try:
-                await product.scroll_into_view_if_needed()
-                await page.wait_for_timeout(150)
-
-                name_el = await product.query_selector(".product-box-content__name")
-                name = (await name_el.inner_text()).strip() if name_el else None
-
-                price_el = await product.query_selector(".product-box-content__price")
-                price_text = (await price_el.inner_text()).strip() if price_el else None
-                price, currency = parse_price(price_text)
-
-                image_bytes = None
-                image_mime = None
-                image_url = None
-                img_el = None
-                for _ in range(4):
-                    if not img_el:
-                        img_el = await product.query_selector(".product-box__image-container img")
-                    if img_el:
-                        image_url = (
-                            await img_el.get_attribute("src")
-                            or await img_el.get_attribute("data-src")
-                            or await img_el.get_attribute("data-srcset")
-                            or await img_el.get_attribute("srcset")
-                        )
-                        if image_url:
-                            # srcset values include size hints; take the first URL
-                            image_url = image_url.split(",")[0].split()[0]
-                            break
-                    await page.wait_for_timeout(200)
+                name = raw.get("name")
+                if not name:
+                    continue
 
-                if image_url:
-                    if image_url.startswith("//"):
-                        image_url = f"https:{image_url}"
-                    elif image_url.startswith("/"):
-                        image_url = f"https://www.bergzeit.de{image_url}"
-
-                    try:
-                        response = await page.context.request.get(image_url)
-                        if response.ok:
-                            image_bytes = await response.body()
-                            image_mime = response.headers.get("content-type")
-                            if image_mime and ";" in image_mime:
-                                image_mime = image_mime.split(";", 1)[0].strip()
-                    except Exception as img_err:
-                        print(f"[{self.name}] Failed to fetch image for {name}: {img_err}")
-
-                url = await product.get_attribute("href")
-                if url and not url.startswith("http"):
-                    url = f"https://www.bergzeit.de{url}"
-
-                item_id = await product.get_attribute("data-item-id")
-
-                if name:
-                    products.append(Product(
-                        name=name,
-                        price=price,
-                        currency=currency,
-                        url=url,
-                        item_id=item_id,
-                        image=image_bytes,
-                        image_mime=image_mime,
-                    ))
+                price, currency = parse_price(raw.get("priceText"))
 
+                image_url = raw.get("imageUrl")
+                if image_url:
+                    # srcset values include size hints; take the first URL
+                    image_url = image_url.split(",")[0].split()[0]
+
+                url = normalize(raw.get("url"), base=self._base_url)
+
+                parsed.append(
+                    {
+                        "name": name,
+                        "price": price,
+                        "currency": currency,
+                        "url": url,
+                        "item_id": raw.get("itemId"),
+                        "image_url": normalize(image_url, base=self._base_url),
+                    }
+                )
             except Exception as e:
                 print(f"[{self.name}] Error extracting product {idx}: {e}")
 
-        return products
+        # Images go through the browser's request context, which shares its cookies.
+        return await self.build_products(None, parsed, fetcher=lambda url: self._fetch_image(page, url))
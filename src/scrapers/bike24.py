@@ -3,6 +3,7 @@
 Bike24 is protected by Cloudflare and blocks headless browsing for the storefront page.
 This scraper uses `r.jina.ai` to fetch a simplified listing representation, then
 downloads product images via Playwright's request context (which is allowed by the CDN).
+The listing response is cached on disk for a few minutes (see `http_cache`).
 """
 
 from __future__ import annotations
@@ -16,6 +17,9 @@ from ..models import Product, ScrapeResult
 from ..utils import parse_price
 from .base import BaseScraper
 from .browser_pool import get_browser_context
+from .http_cache import cache_get, cache_put
+from .image_cache import cached_fetch
+from .urlutils import normalize
 
 
 class Bike24Scraper(BaseScraper):
@@ -23,24 +27,37 @@ class Bike24Scraper(BaseScraper):
     display_name = "Bike24"
     url = "https://www.bike24.com/brands/blackroll/category-76"
 
-    _PRODUCT_LINK_RE = re.compile(
-        r'\]\(https://www\.bike24\.com/p(?P<id>\d+)\.html\s+"(?P<title>[^"]+)"\)'
+    # Single-pass tokenizer over the raw UTF-8 listing bytes: product links, image
+    # URLs and prices in document order. Only captured groups get decoded.
+    # `\xc2\xa0` is a UTF-8 NBSP and `\xe2\x82\xac` is "€" (bytes `\s` is ASCII-only).
+    _TOKEN_RE = re.compile(
+        rb'(?P<link>\]\(https://www\.bike24\.com/p(?P<id>\d+)\.html\s+"(?P<title>[^"]+)"\))'
+        rb"|(?P<img>https://images\.bike24\.com/[^\s)]+)"
+        rb"|(?P<price>(?:from\s+)?\d(?:[\d\s.,]|\xc2\xa0)*(?:\s|\xc2\xa0)*\xe2\x82\xac)",
+        flags=re.IGNORECASE,
     )
-    _IMAGE_URL_RE = re.compile(r"(https://images\.bike24\.com/[^\s)]+)")
-    _PRICE_RE = re.compile(r"(?:from\s+)?[\d][\d\s.,]*\s*€", flags=re.IGNORECASE)
+    # Images/prices further than this before a product link belong to something else.
+    _CONTEXT_WINDOW = 900
+    # The listing changes slowly; reuse the r.jina.ai response for repeated runs.
+    _LISTING_CACHE_TTL = 600
 
     async def scrape(self) -> ScrapeResult:
         async with get_browser_context() as context:
             listing_url = f"https://r.jina.ai/{self.url}"
-            print(f"[{self.name}] Loading {listing_url}...")
-            resp = await context.request.get(
-                listing_url,
-                timeout=60000,
-                headers={"Accept": "text/plain"},
-            )
-            if not resp.ok:
-                raise RuntimeError(f"Failed to load listing via r.jina.ai: HTTP {resp.status}")
-            markdown = await resp.text()
+            markdown = cache_get(listing_url, ttl=self._LISTING_CACHE_TTL)
+            if markdown is not None:
+                print(f"[{self.name}] Using cached listing for {listing_url}")
+            else:
+                print(f"[{self.name}] Loading {listing_url}...")
+                resp = await context.request.get(
+                    listing_url,
+                    timeout=60000,
+                    headers={"Accept": "text/plain"},
+                )
+                if not resp.ok:
+                    raise RuntimeError(f"Failed to load listing via r.jina.ai: HTTP {resp.status}")
+                markdown = await resp.body()
+                cache_put(listing_url, markdown)
 
             products = await self._extract_products_from_markdown(markdown, page_context=context)
             print(f"[{self.name}] Extracted {len(products)} products")
@@ -70,6 +87,10 @@ class Bike24Scraper(BaseScraper):
             resp = await page_context.request.get(image_url, timeout=30000)
             if not resp.ok:
                 return None, None
+            # Placeholders are tiny; skip transferring the body when the header already says so.
+            content_length = resp.headers.get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) < 800:
+                return None, None
             body = await resp.body()
             if len(body) < 800:
                 return None, None
@@ -81,35 +102,45 @@ class Bike24Scraper(BaseScraper):
             print(f"[{self.name}] Failed to fetch image {image_url}: {img_err}")
             return None, None
 
-    async def _extract_products_from_markdown(self, markdown: str, *, page_context) -> list[Product]:
+    async def _extract_products_from_markdown(self, markdown: bytes, *, page_context) -> list[Product]:
         products: list[Product] = []
         seen_ids: set[str] = set()
 
-        for match in self._PRODUCT_LINK_RE.finditer(markdown):
-            item_id = match.group("id")
+        last_img: tuple[int, bytes] | None = None
+        last_price: tuple[int, bytes] | None = None
+
+        for match in self._TOKEN_RE.finditer(markdown):
+            if match.lastgroup == "img":
+                last_img = (match.start(), match.group("img"))
+                continue
+            if match.lastgroup == "price":
+                last_price = (match.start(), match.group("price"))
+                continue
+
+            window_start = match.start() - self._CONTEXT_WINDOW
+            img, last_img = last_img, None
+            price_token, last_price = last_price, None
+
+            item_id = match.group("id").decode("ascii")
             if item_id in seen_ids:
                 continue
             seen_ids.add(item_id)
 
-            name = match.group("title").strip()
+            name = match.group("title").decode("utf-8", errors="replace").strip()
             url = f"https://www.bike24.com/p{item_id}.html"
 
-            ctx = markdown[max(0, match.start() - 900) : match.start()]
-
             image_url = None
-            img_matches = list(self._IMAGE_URL_RE.finditer(ctx))
-            if img_matches:
-                image_url = img_matches[-1].group(1)
+            if img and img[0] >= window_start:
+                image_url = normalize(img[1].decode("utf-8", errors="replace"), base=self.url)
 
             price_text = None
-            price_matches = list(self._PRICE_RE.finditer(ctx))
-            if price_matches:
-                price_text = price_matches[-1].group(0)
+            if price_token and price_token[0] >= window_start:
+                price_text = price_token[1].decode("utf-8", errors="replace")
 
             price, currency = parse_price(price_text)
-            image_bytes, image_mime = await self._fetch_image(
-                page_context=page_context,
-                image_url=image_url,
+            image_bytes, image_mime = await cached_fetch(
+                image_url,
+                lambda u: self._fetch_image(page_context=page_context, image_url=u),
             )
 
             products.append(
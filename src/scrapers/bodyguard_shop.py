@@ -2,17 +2,31 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import math
 import re
 from datetime import UTC, datetime
-from urllib.parse import urljoin
+from urllib.parse import urlsplit
 
-from playwright.async_api import BrowserContext, Page
+import httpx
+import orjson
+from playwright.async_api import Page
 
 from ..models import Product, ScrapeResult
 from ..utils import parse_price
 from .base import BaseScraper
-from .browser_pool import get_browser_context
+from .http_cache import cache_get, cache_put
+from .urlutils import normalize
+
+_SHOPIFY_CURRENCY_RE = re.compile(r"Shopify\.currency\s*=\s*(\{[^;]+\})")
+_ACTIVE_CURRENCY_RE = re.compile(r'"active"\s*:\s*"([A-Z]{3})"')
+_ISO_CURRENCY_RE = re.compile(r"[A-Z]{3}")
+
+_IMAGE_HEADERS = {
+    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+    "Sec-Fetch-Dest": "image",
+    "Sec-Fetch-Mode": "no-cors",
+}
 
 
 class BodyguardShopScraper(BaseScraper):
@@ -23,14 +37,38 @@ class BodyguardShopScraper(BaseScraper):
     url = "https://bodyguard-shop.ch/en/collections/blackroll"
 
     _base_url = "https://bodyguard-shop.ch"
-    _collection_json_template = (
-        "https://bodyguard-shop.ch/en/collections/blackroll/products.json?limit=250&page={page}"
-    )
+    _collection_json_prefix = "https://bodyguard-shop.ch/en/collections/blackroll/products.json?limit=250&page="
+    _collection_meta_url = "https://bodyguard-shop.ch/en/collections/blackroll.json"
+    _default_currency = "CHF"
+    _PAGE_SIZE = 250
+    _MAX_PAGES = 20
+    # Pages requested concurrently per round; a short page ends pagination.
+    _PAGE_BATCH = 4
+    # A shop's currency effectively never changes; re-probe the HTML at most monthly.
+    _CURRENCY_CACHE_TTL = 30 * 24 * 3600
+
+    _headers = {
+        "user-agent": (
+            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+        ),
+        "accept-language": "en-US,en;q=0.9,de-CH;q=0.8",
+    }
 
     async def scrape(self) -> ScrapeResult:
-        async with get_browser_context() as context:
-            currency = await self._infer_currency(context) or "CHF"
-            products = await self._fetch_products(context, currency=currency)
+        # Only JSON and image endpoints are needed, so skip Chromium entirely. All
+        # requests hit one host, so a single HTTP/2 connection carries them.
+        async with httpx.AsyncClient(
+            headers=self._headers,
+            http2=True,
+            follow_redirects=True,
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+        ) as client:
+            items, json_currency = await self._fetch_items(client)
+            # The HTML probe costs a full page download; only use it when the JSON has no currency.
+            currency = json_currency or await self._host_currency(client) or self._default_currency
+            products = await self._fetch_products(client, items, currency=currency)
             print(f"[{self.name}] Extracted {len(products)} products")
 
         return ScrapeResult(
@@ -44,29 +82,35 @@ class BodyguardShopScraper(BaseScraper):
         _ = page
         raise RuntimeError("BodyguardShopScraper uses Shopify JSON endpoints (extract_products is unused).")
 
-    async def _infer_currency(self, context: BrowserContext) -> str | None:
+    async def _host_currency(self, client: httpx.AsyncClient) -> str | None:
+        """Return the shop currency from the on-disk cache, probing the HTML only on a miss."""
+        key = f"currency:{urlsplit(self._base_url).netloc}"
+        if cached := cache_get(key, ttl=self._CURRENCY_CACHE_TTL):
+            return cached.decode("ascii")
+        currency = await self._infer_currency(client)
+        if currency:
+            cache_put(key, currency.encode("ascii"))
+        return currency
+
+    async def _infer_currency(self, client: httpx.AsyncClient) -> str | None:
         try:
-            resp = await context.request.get(
-                self.url,
-                headers={"Accept": "text/html"},
-                timeout=60000,
-            )
-            if not resp.ok:
+            resp = await client.get(self.url, headers={"Accept": "text/html"})
+            if resp.status_code >= 400:
                 return None
-            html = await resp.text()
+            html = resp.text
         except Exception:
             return None
 
-        if match := re.search(r'Shopify\\.currency\\s*=\\s*(\\{[^;]+\\})', html):
+        if match := _SHOPIFY_CURRENCY_RE.search(html):
             try:
-                payload = json.loads(match.group(1))
+                payload = orjson.loads(match.group(1))
                 active = payload.get("active")
-                if isinstance(active, str) and re.fullmatch(r"[A-Z]{3}", active.strip()):
+                if isinstance(active, str) and _ISO_CURRENCY_RE.fullmatch(active.strip()):
                     return active.strip()
             except Exception:
                 pass
 
-        if match := re.search(r'\"active\"\\s*:\\s*\"([A-Z]{3})\"', html):
+        if match := _ACTIVE_CURRENCY_RE.search(html):
             return match.group(1)
 
         return None
@@ -91,109 +135,120 @@ class BodyguardShopScraper(BaseScraper):
         return min(prices) if prices else None
 
     @staticmethod
-    def _normalize_url(base_url: str, value: str | None) -> str | None:
-        if not value or not isinstance(value, str):
+    def _json_currency(payload: object) -> str | None:
+        """Currency from a products.json payload, if the shop exposes one."""
+        if not isinstance(payload, dict):
             return None
-        url = value.strip()
-        if not url:
-            return None
-        if url.startswith("//"):
-            return "https:" + url
-        if url.startswith("/"):
-            return urljoin(base_url, url)
-        return url
+        candidates: list[object] = [payload.get("currency")]
+        items = payload.get("products")
+        if isinstance(items, list) and items and isinstance(items[0], dict):
+            variants = items[0].get("variants")
+            if isinstance(variants, list) and variants and isinstance(variants[0], dict):
+                candidates += [variants[0].get("price_currency"), variants[0].get("currency")]
+        for value in candidates:
+            if isinstance(value, str) and _ISO_CURRENCY_RE.fullmatch(value.strip()):
+                return value.strip()
+        return None
 
-    async def _fetch_image(self, context: BrowserContext, image_url: str | None) -> tuple[bytes | None, str | None]:
-        image_url = self._normalize_url(self._base_url, image_url)
-        if not image_url:
-            return None, None
+    async def _fetch_page(self, client: httpx.AsyncClient, page_num: int) -> dict:
+        json_url = f"{self._collection_json_prefix}{page_num}"
+        resp = await client.get(json_url, headers={"Accept": "application/json"})
+        if resp.status_code >= 400:
+            raise RuntimeError(f"Failed to load collection JSON: HTTP {resp.status_code}")
+
+        payload = orjson.loads(resp.content)
+        if not isinstance(payload, dict):
+            return {}
+        items = payload.get("products")
+        if items and not isinstance(items, list):
+            raise RuntimeError("Unexpected collection JSON shape: products is not a list")
+        return payload
+
+    async def _fetch_products_count(self, client: httpx.AsyncClient) -> int | None:
+        """Read `products_count` from the collection JSON, or None if unavailable."""
+        try:
+            resp = await client.get(self._collection_meta_url, headers={"Accept": "application/json"})
+            if resp.status_code >= 400:
+                return None
+            count = orjson.loads(resp.content)["collection"]["products_count"]
+        except Exception:
+            return None
+        return count if isinstance(count, int) and count >= 0 else None
+
+    async def _fetch_items(self, client: httpx.AsyncClient) -> tuple[list, str | None]:
+        """Fetch collection pages concurrently until a short page (or the known total) marks the end.
+
+        When the collection reports its product count, exactly that many pages are requested
+        in one round; otherwise pages are fetched in speculative batches.
+        Returns the raw product items plus the currency found in the JSON (if any).
+        """
+        # Progress is reported once per run rather than per page.
+        print(f"[{self.name}] Loading {self._collection_json_prefix}...")
+        count = await self._fetch_products_count(client)
+        batch = self._PAGE_BATCH
+        if count is not None:
+            batch = min(self._MAX_PAGES, max(1, math.ceil(count / self._PAGE_SIZE)))
+
+        all_items: list = []
+        currency: str | None = None
+        pages_used = 0
+        start = 1
+        while start <= self._MAX_PAGES:
+            page_nums = range(start, min(start + batch, self._MAX_PAGES + 1))
+            pages = await asyncio.gather(*(self._fetch_page(client, n) for n in page_nums))
+            for payload in pages:
+                pages_used += 1
+                items = payload.get("products") or []
+                currency = currency or self._json_currency(payload)
+                all_items.extend(items)
+                if len(items) < self._PAGE_SIZE:
+                    # Later pages in this batch were speculative; discard them.
+                    print(f"[{self.name}] Loaded {len(all_items)} items from {pages_used} page(s)")
+                    return all_items, currency
+            if count is not None and len(all_items) == count:
+                break
+            # The count was stale (or missing); keep going in speculative batches.
+            start += len(page_nums)
+            batch = self._PAGE_BATCH
+        print(f"[{self.name}] Loaded {len(all_items)} items from {pages_used} page(s)")
+        return all_items, currency
 
+    @staticmethod
+    def _extract_image_url(item: dict) -> str | None:
         try:
-            resp = await context.request.get(
-                image_url,
-                headers={
-                    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
-                    "Referer": self.url,
-                    "Sec-Fetch-Dest": "image",
-                    "Sec-Fetch-Mode": "no-cors",
-                },
-                timeout=30000,
-            )
-            if not resp.ok:
-                return None, None
-            body = await resp.body()
-            if len(body) < 800:
-                return None, None
-            mime = resp.headers.get("content-type")
-            if mime and ";" in mime:
-                mime = mime.split(";", 1)[0].strip()
-            return body, mime
-        except Exception as img_err:
-            print(f"[{self.name}] Failed to fetch image: {img_err}")
-            return None, None
-
-    async def _fetch_products(self, context: BrowserContext, *, currency: str) -> list[Product]:
-        all_products: list[Product] = []
-
-        for page_num in range(1, 21):
-            json_url = self._collection_json_template.format(page=page_num)
-            print(f"[{self.name}] Loading {json_url}...")
-            resp = await context.request.get(
-                json_url,
-                headers={"Accept": "application/json"},
-                timeout=60000,
-            )
-            if not resp.ok:
-                raise RuntimeError(f"Failed to load collection JSON: HTTP {resp.status}")
+            first = item["images"][0]
+            src = first if isinstance(first, str) else first["src"]
+        except (KeyError, IndexError, TypeError):
+            src = None
+        if not src:
+            try:
+                src = item["image"]["src"]
+            except (KeyError, TypeError):
+                return None
+        return src if isinstance(src, str) else None
 
-            payload = await resp.json()
-            items = payload.get("products") if isinstance(payload, dict) else None
-            if not items:
-                break
+    async def _fetch_products(self, client: httpx.AsyncClient, items: list, *, currency: str) -> list[Product]:
+        parsed: list[dict] = []
+        for item in items:
+            # Nearly every item is well-formed, so take the happy path and let bad shapes raise.
+            try:
+                title = (item["title"] or "").strip()
+                handle = (item["handle"] or "").strip()
+            except (KeyError, AttributeError, TypeError):
+                continue
+            if not title or not handle:
+                continue
 
-            if not isinstance(items, list):
-                raise RuntimeError("Unexpected collection JSON shape: products is not a list")
-
-            for idx, item in enumerate(items):
-                if not isinstance(item, dict):
-                    continue
-                title = (item.get("title") or "").strip()
-                handle = (item.get("handle") or "").strip()
-                if not title or not handle:
-                    continue
-
-                product_url = f"{self._base_url}/en/products/{handle}"
-                item_id = str(item.get("id") or handle)
-                price = self._best_price(item)
-
-                image_url: str | None = None
-                images = item.get("images")
-                if isinstance(images, list) and images:
-                    first = images[0]
-                    if isinstance(first, str):
-                        image_url = first
-                    elif isinstance(first, dict):
-                        src = first.get("src")
-                        image_url = src if isinstance(src, str) else None
-                if not image_url and isinstance(item.get("image"), dict):
-                    src = item["image"].get("src")
-                    image_url = src if isinstance(src, str) else None
-
-                image_bytes, image_mime = await self._fetch_image(context, image_url)
-
-                all_products.append(
-                    Product(
-                        name=title,
-                        price=price,
-                        currency=currency,
-                        url=product_url,
-                        item_id=item_id,
-                        image=image_bytes,
-                        image_mime=image_mime,
-                    )
-                )
-
-            if len(items) < 250:
-                break
+            parsed.append(
+                {
+                    "name": title,
+                    "url": f"{self._base_url}/en/products/{handle}",
+                    "item_id": str(item.get("id") or handle),
+                    "price": self._best_price(item),
+                    "currency": currency,
+                    "image_url": normalize(self._extract_image_url(item), base=self._base_url),
+                }
+            )
 
-        return all_products
+        # Variants often share a hero image; identical URLs are downloaded once.
+        return await self.build_products(client, parsed, headers={**_IMAGE_HEADERS, "Referer": self.url})
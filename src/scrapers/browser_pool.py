@@ -4,9 +4,82 @@ from __future__ import annotations
 
 import asyncio
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import AsyncIterator
+from urllib.parse import urlsplit
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright, Route
+
+# Resource types no scraper reads; aborting them lets pages settle sooner.
+DEFAULT_BLOCKED_RESOURCES: frozenset[str] = frozenset({"font", "media"})
+
+# Extra launch flags per engine; keeps navigator.webdriver hints off for all scrapers.
+_LAUNCH_ARGS: dict[str, list[str]] = {
+    "chromium": ["--disable-blink-features=AutomationControlled"],
+}
+
+# Analytics/ad hosts blocked whenever resource blocking is enabled. Tag managers are
+# deliberately not listed: some scrapers read `window.dataLayer`.
+BLOCKED_TRACKER_HOSTS: tuple[str, ...] = (
+    "google-analytics.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "facebook.net",
+    "hotjar.com",
+    "criteo.com",
+    "criteo.net",
+    "clarity.ms",
+    "bat.bing.com",
+    "optimizely.com",
+)
+
+# Wipes the current origin's client-side storage so a parked context starts clean.
+_CLEAR_ORIGIN_STORAGE_JS = """
+async () => {
+  try { localStorage.clear(); } catch (e) {}
+  try { sessionStorage.clear(); } catch (e) {}
+  try {
+    for (const db of (await indexedDB.databases?.()) || []) {
+      if (db.name) indexedDB.deleteDatabase(db.name);
+    }
+  } catch (e) {}
+  try {
+    for (const reg of await navigator.serviceWorker.getRegistrations()) await reg.unregister();
+  } catch (e) {}
+  try {
+    for (const name of await caches.keys()) await caches.delete(name);
+  } catch (e) {}
+}
+"""
+
+ContextKey = tuple[
+    str,
+    str | None,
+    str | None,
+    tuple[tuple[str, int], ...] | None,
+    tuple[str, ...],
+    frozenset[str] | None,
+    str | None,
+]
+
+
+def _is_tracker_url(url: str) -> bool:
+    host = urlsplit(url).hostname or ""
+    return any(host == t or host.endswith("." + t) for t in BLOCKED_TRACKER_HOSTS)
+
+
+async def install_resource_blocking(context: BrowserContext, blocked_types: frozenset[str]) -> None:
+    """Abort requests of `blocked_types` and to tracker hosts for every page of `context`."""
+
+    async def handle(route: Route) -> None:
+        request = route.request
+        if request.resource_type in blocked_types or _is_tracker_url(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", handle)
 
 
 class BrowserPool:
@@ -16,16 +89,36 @@ class BrowserPool:
     Creating browser contexts is much faster than launching new browsers.
     Typical browser launch: 3-5 seconds
     Context creation: ~50-100ms
+
+    Released contexts are kept idle (keyed by their options) and handed out again
+    to the next scrape with the same settings, after closing their pages and
+    clearing cookies and origin storage. At most `max_contexts` users hold a context at
+    once; each user of a shared context (below) counts as one.
+
+    Scrapers can instead pass a `storage_state` file: one context per option set is
+    then shared by all concurrent and later users (refcounted) and kept alive with its
+    cookies, HTTP cache and connections until the pool shuts down. It is seeded from
+    that JSON file (cookies + localStorage) and writes it back whenever its last user
+    releases it, so the session also survives between runs.
     """
 
     _instance: BrowserPool | None = None
     _lock = asyncio.Lock()
 
+    max_contexts: int = 4
+    max_idle_per_key: int = 1
+
     def __init__(self):
         self._playwright: Playwright | None = None
         self._browsers: dict[str, Browser] = {}
         self._active_contexts: int = 0
         self._browser_launch_lock = asyncio.Lock()
+        self._context_slots = asyncio.Semaphore(self.max_contexts)
+        self._idle_contexts: dict[ContextKey, list[BrowserContext]] = {}
+        self._shared_contexts: dict[ContextKey, BrowserContext] = {}
+        # Per context, not per key: a key whose context died gets a fresh count.
+        self._shared_refcounts: dict[BrowserContext, int] = {}
+        self._shared_lock = asyncio.Lock()
 
     @classmethod
     async def get_instance(cls) -> BrowserPool:
@@ -36,22 +129,30 @@ class BrowserPool:
                     cls._instance = cls()
         return cls._instance
 
-    async def _ensure_browser(self, browser_type: str) -> Browser:
-        """Ensure the requested browser engine is started, launching if necessary."""
+    @staticmethod
+    def _normalize_browser_type(browser_type: str) -> str:
         normalized = (browser_type or "chromium").strip().lower()
         if normalized not in {"chromium", "firefox", "webkit"}:
             raise ValueError(f"Unsupported browser_type: {browser_type!r}")
+        return normalized
+
+    async def _ensure_playwright(self) -> Playwright:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        return self._playwright
+
+    async def _ensure_browser(self, browser_type: str) -> Browser:
+        """Ensure the requested browser engine is started, launching if necessary."""
+        normalized = self._normalize_browser_type(browser_type)
 
         async with self._browser_launch_lock:
             existing = self._browsers.get(normalized)
             if existing is not None and existing.is_connected():
                 return existing
 
-            if self._playwright is None:
-                self._playwright = await async_playwright().start()
-
-            launcher = getattr(self._playwright, normalized)
-            browser = await launcher.launch(headless=True)
+            playwright = await self._ensure_playwright()
+            launcher = getattr(playwright, normalized)
+            browser = await launcher.launch(headless=True, args=_LAUNCH_ARGS.get(normalized, []))
             self._browsers[normalized] = browser
             return browser
 
@@ -64,13 +165,127 @@ class BrowserPool:
         locale: str | None = None,
         viewport: dict[str, int] | None = None,
         init_scripts: list[str] | None = None,
+        block_resources: frozenset[str] | None = DEFAULT_BLOCKED_RESOURCES,
+        storage_state: str | Path | None = None,
     ) -> AsyncIterator[BrowserContext]:
         """
-        Get a fresh browser context from the pool.
+        Get a browser context from the pool.
+
+        Contexts are isolated (separate cookies and storage) but share the browser process.
+        An idle context created with the same options is reused when available; it is wiped
+        before being parked (see `_release_context`).
+
+        `block_resources` lists Playwright resource types to abort (known tracker hosts
+        are aborted too); pass `None` to disable request blocking entirely.
 
-        Contexts are isolated (separate cookies, storage) but share the browser process.
+        With `storage_state` the context is shared rather than checked out: it is not
+        reset between users, stays open until `close()` and persists cookies/localStorage
+        to that file.
         """
-        browser = await self._ensure_browser(browser_type)
+        blocked = frozenset(block_resources) if block_resources is not None else None
+        key: ContextKey = (
+            self._normalize_browser_type(browser_type),
+            user_agent,
+            locale,
+            tuple(sorted(viewport.items())) if viewport else None,
+            tuple(init_scripts or ()),
+            blocked,
+            str(storage_state) if storage_state else None,
+        )
+
+        async with self._context_slots:
+            if storage_state:
+                async with self._shared_context(
+                    key,
+                    browser_type,
+                    user_agent=user_agent,
+                    locale=locale,
+                    viewport=viewport,
+                    init_scripts=init_scripts,
+                    block_resources=blocked,
+                    storage_state=storage_state,
+                ) as context:
+                    yield context
+                return
+
+            context = self._take_idle_context(key)
+            if context is None:
+                context = await self._new_context(
+                    browser_type,
+                    user_agent=user_agent,
+                    locale=locale,
+                    viewport=viewport,
+                    init_scripts=init_scripts,
+                    block_resources=blocked,
+                )
+            self._active_contexts += 1
+            try:
+                yield context
+            finally:
+                self._active_contexts -= 1
+                await self._release_context(key, context)
+
+    @asynccontextmanager
+    async def _shared_context(
+        self,
+        key: ContextKey,
+        browser_type: str,
+        **options,
+    ) -> AsyncIterator[BrowserContext]:
+        async with self._shared_lock:
+            context = self._shared_contexts.get(key)
+            browser = context.browser if context is not None else None
+            if browser is not None and not browser.is_connected():
+                context = None
+            if context is None:
+                context = await self._new_context(browser_type, **options)
+                self._shared_contexts[key] = context
+                self._shared_refcounts[context] = 0
+
+                def forget(closed: BrowserContext, key: ContextKey = key) -> None:
+                    # Fires on explicit close and when the browser goes away.
+                    self._shared_refcounts.pop(closed, None)
+                    if self._shared_contexts.get(key) is closed:
+                        del self._shared_contexts[key]
+
+                context.on("close", forget)
+            self._shared_refcounts[context] += 1
+
+        self._active_contexts += 1
+        try:
+            yield context
+        finally:
+            self._active_contexts -= 1
+            remaining = self._shared_refcounts.get(context)
+            if remaining is not None:
+                remaining -= 1
+                self._shared_refcounts[context] = remaining
+            if remaining == 0 and self._shared_contexts.get(key) is context:
+                # Keep the context (and its caches) warm, but don't leak pages.
+                for page in list(context.pages):
+                    try:
+                        await page.close()
+                    except Exception:
+                        continue
+                if state_path := options.get("storage_state"):
+                    try:
+                        Path(state_path).parent.mkdir(parents=True, exist_ok=True)
+                        await context.storage_state(path=str(state_path))
+                    except Exception:
+                        # Best-effort: a missing state file only costs a cold start.
+                        pass
+
+    async def _new_context(
+        self,
+        browser_type: str,
+        *,
+        user_agent: str | None,
+        locale: str | None,
+        viewport: dict[str, int] | None,
+        init_scripts: list[str] | None,
+        block_resources: frozenset[str] | None,
+        storage_state: str | Path | None = None,
+    ) -> BrowserContext:
         context_kwargs: dict[str, object] = {}
         if user_agent:
             context_kwargs["user_agent"] = user_agent
@@ -79,6 +294,9 @@ class BrowserPool:
         if viewport:
             context_kwargs["viewport"] = viewport
 
+        if storage_state and Path(storage_state).is_file():
+            context_kwargs["storage_state"] = str(storage_state)
+        browser = await self._ensure_browser(browser_type)
         context = await browser.new_context(**context_kwargs)
         if init_scripts:
             for script in init_scripts:
@@ -87,15 +305,64 @@ class BrowserPool:
                 except Exception:
                     # Best-effort: individual scripts may fail on some sites.
                     continue
-        self._active_contexts += 1
+        if block_resources is not None:
+            await install_resource_blocking(context, block_resources)
+        return context
+
+    def _take_idle_context(self, key: ContextKey) -> BrowserContext | None:
+        idle = self._idle_contexts.get(key)
+        while idle:
+            context = idle.pop()
+            browser = context.browser
+            if browser is not None and browser.is_connected():
+                return context
+        return None
+
+    async def _release_context(self, key: ContextKey, context: BrowserContext) -> None:
+        """Reset a context and park it for reuse, or close it if the idle slot is taken.
+
+        Cookies and the storage of every origin still open are wiped; a context that still
+        holds localStorage or a service worker afterwards (e.g. from an origin it navigated
+        away from) is closed rather than handed to the next scraper.
+        """
+        idle = self._idle_contexts.setdefault(key, [])
+        if len(idle) < self.max_idle_per_key:
+            try:
+                for page in list(context.pages):
+                    for frame in page.frames:
+                        try:
+                            await frame.evaluate(_CLEAR_ORIGIN_STORAGE_JS)
+                        except Exception:
+                            continue
+                    await page.close()
+                await context.clear_cookies()
+                state = await context.storage_state()
+                if not state.get("origins") and not context.service_workers:
+                    idle.append(context)
+                    return
+            except Exception:
+                pass
         try:
-            yield context
-        finally:
-            self._active_contexts -= 1
             await context.close()
+        except Exception:
+            pass
 
     async def close(self) -> None:
         """Close the browser and cleanup resources."""
+        for contexts in self._idle_contexts.values():
+            for context in contexts:
+                try:
+                    await context.close()
+                except Exception:
+                    continue
+        self._idle_contexts = {}
+        for context in list(self._shared_contexts.values()):
+            try:
+                await context.close()
+            except Exception:
+                continue
+        self._shared_contexts = {}
+        self._shared_refcounts = {}
         for browser in list(self._browsers.values()):
             try:
                 await browser.close()
@@ -128,6 +395,8 @@ async def get_browser_context(
     locale: str | None = None,
     viewport: dict[str, int] | None = None,
     init_scripts: list[str] | None = None,
+    block_resources: frozenset[str] | None = DEFAULT_BLOCKED_RESOURCES,
+    storage_state: str | Path | None = None,
 ) -> AsyncIterator[BrowserContext]:
     """Get a browser context from the shared pool."""
     pool = await BrowserPool.get_instance()
@@ -137,5 +406,7 @@ async def get_browser_context(
         locale=locale,
         viewport=viewport,
         init_scripts=init_scripts,
+        block_resources=block_resources,
+        storage_state=storage_state,
     ) as context:
         yield context
@@ -2,14 +2,19 @@
 
 from __future__ import annotations
 
+import html
+import re
 from datetime import datetime, UTC
 from urllib.parse import urljoin
 
+import httpx
+import orjson
 from playwright.async_api import Page
 
 from ..models import Product, ScrapeResult
 from .base import BaseScraper
 from .browser_pool import get_browser_context
+from .http_cache import DEFAULT_CACHE_DIR, cache_enabled
 
 
 _DESKTOP_UA = (
@@ -21,6 +26,16 @@ _HIDE_WEBDRIVER = """
 Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
 """
 
+# The product page renders its dataLayer server-side, so the HTML alone is enough.
+_DATA_LAYER_RE = re.compile(r"dataLayer\s*=\s*(\[.*?\]);", re.DOTALL)
+_OG_IMAGE_TAG_RE = re.compile(r"<meta\b[^>]*?property=[\"']og:image[\"'][^>]*>", re.IGNORECASE)
+_CONTENT_ATTR_RE = re.compile(r"content=[\"']([^\"']*)[\"']", re.IGNORECASE)
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+# Cookies/localStorage for the browser fallback, kept between runs. A state file rather
+# than a Chromium profile, which only one browser process can have open at a time.
+_STATE_FILE = DEFAULT_CACHE_DIR / "state" / "bunert.json"
+
 
 class BunertScraper(BaseScraper):
     name = "bunert"
@@ -28,30 +43,95 @@ class BunertScraper(BaseScraper):
     url = "https://www.bunert.de/blackroll-standard-faszienrolle"
 
     async def scrape(self) -> ScrapeResult:
+        products = await self._scrape_http()
+        if products is None:
+            print(f"[{self.name}] No dataLayer in HTML, falling back to browser")
+            products = await self._scrape_browser()
+        print(f"[{self.name}] Extracted {len(products)} products")
+
+        return ScrapeResult(
+            source=self.name,
+            source_url=self.url,
+            scraped_at=datetime.now(UTC),
+            products=products,
+        )
+
+    async def _scrape_http(self) -> list[Product] | None:
+        """Scrape from the raw HTML; returns None when the dataLayer cannot be recovered."""
+        headers = {"User-Agent": _DESKTOP_UA, "Accept-Language": "de-DE"}
+        async with httpx.AsyncClient(headers=headers, follow_redirects=True, timeout=httpx.Timeout(60.0)) as client:
+            print(f"[{self.name}] Loading {self.url}...")
+            try:
+                resp = await client.get(self.url)
+                resp.raise_for_status()
+            except Exception as e:
+                print(f"[{self.name}] HTTP fetch failed: {e}")
+                return None
+
+            page_url = str(resp.url)
+            text = resp.text
+            match = _DATA_LAYER_RE.search(text)
+            if not match:
+                return None
+            try:
+                data_layer = orjson.loads(match.group(1))
+            except orjson.JSONDecodeError:
+                return None
+            dl_products, currency = self._parse_data_layer(data_layer)
+            if not dl_products:
+                return None
+
+            title = None
+            if title_match := _TITLE_RE.search(text):
+                title = html.unescape(title_match.group(1))
+
+            image_url = None
+            if tag := _OG_IMAGE_TAG_RE.search(text):
+                if content := _CONTENT_ATTR_RE.search(tag.group(0)):
+                    image_url = urljoin(page_url, html.unescape(content.group(1)))
+
+            image_bytes = None
+            image_mime = None
+            if image_url:
+                try:
+                    image_bytes, image_mime = await self._fetch_image_http(client, image_url, referer=page_url)
+                except Exception as e:
+                    print(f"[{self.name}] Failed to fetch image: {e}")
+
+        return self._build_products(
+            dl_products,
+            currency,
+            title=title,
+            url=page_url,
+            image=image_bytes,
+            image_mime=image_mime,
+        )
+
+    async def _scrape_browser(self) -> list[Product]:
         async with get_browser_context(
             user_agent=_DESKTOP_UA,
             locale="de-DE",
             viewport={"width": 1400, "height": 900},
             init_scripts=[_HIDE_WEBDRIVER],
+            storage_state=_STATE_FILE if cache_enabled() else None,
         ) as context:
             page = await context.new_page()
             print(f"[{self.name}] Loading {self.url}...")
             await page.goto(self.url, wait_until="domcontentloaded", timeout=90000)
-            await page.wait_for_timeout(400)
-
-            products = await self.extract_products(page)
-            print(f"[{self.name}] Extracted {len(products)} products")
+            try:
+                # The dataLayer is usually inlined, so this returns almost immediately.
+                await page.wait_for_function(
+                    """() => Array.isArray(window.dataLayer)
+                        && window.dataLayer.some(e => e?.ecommerce?.detail?.products?.length)""",
+                    timeout=2000,
+                )
+            except Exception:
+                pass
 
-        return ScrapeResult(
-            source=self.name,
-            source_url=self.url,
-            scraped_at=datetime.now(UTC),
-            products=products,
-        )
+            return await self.extract_products(page)
 
     @staticmethod
-    async def _data_layer_products(page: Page) -> tuple[list[dict], str | None]:
-        data_layer = await page.evaluate("() => window.dataLayer || []")
+    def _parse_data_layer(data_layer: object) -> tuple[list[dict], str | None]:
         if not isinstance(data_layer, list):
             return [], None
 
@@ -70,6 +150,32 @@ class BunertScraper(BaseScraper):
                 return [p for p in products if isinstance(p, dict)], currency if isinstance(currency, str) else None
         return [], None
 
+    @classmethod
+    async def _data_layer_products(cls, page: Page) -> tuple[list[dict], str | None]:
+        data_layer = await page.evaluate("() => window.dataLayer || []")
+        return cls._parse_data_layer(data_layer)
+
+    @staticmethod
+    async def _fetch_image_http(
+        client: httpx.AsyncClient, image_url: str, *, referer: str
+    ) -> tuple[bytes | None, str | None]:
+        headers = {
+            "Accept": "image/avif,image/webp,image/*,*/*;q=0.8",
+            "Referer": referer,
+            "Sec-Fetch-Dest": "image",
+            "Sec-Fetch-Mode": "no-cors",
+        }
+        resp = await client.get(image_url, headers=headers, timeout=45.0)
+        if resp.status_code >= 400:
+            return None, None
+        body = resp.content
+        if len(body) < 800:
+            return None, None
+        mime = resp.headers.get("content-type")
+        if mime and ";" in mime:
+            mime = mime.split(";", 1)[0].strip()
+        return body, mime
+
     @staticmethod
     async def _fetch_image(page: Page, image_url: str) -> tuple[bytes | None, str | None]:
         headers = {
@@ -92,6 +198,43 @@ class BunertScraper(BaseScraper):
     async def extract_products(self, page: Page) -> list[Product]:
         dl_products, currency = await self._data_layer_products(page)
 
+        title = None
+        try:
+            title = await page.title()
+        except Exception:
+            title = None
+
+        image_url = await page.get_attribute('meta[property="og:image"]', "content")
+        if image_url:
+            image_url = urljoin(page.url, image_url)
+
+        image_bytes = None
+        image_mime = None
+        if image_url:
+            try:
+                image_bytes, image_mime = await self._fetch_image(page, image_url)
+            except Exception as e:
+                print(f"[{self.name}] Failed to fetch image: {e}")
+
+        return self._build_products(
+            dl_products,
+            currency,
+            title=title,
+            url=page.url,
+            image=image_bytes,
+            image_mime=image_mime,
+        )
+
+    @staticmethod
+    def _build_products(
+        dl_products: list[dict],
+        currency: str | None,
+        *,
+        title: str | None,
+        url: str,
+        image: bytes | None,
+        image_mime: str | None,
+    ) -> list[Product]:
         name = None
         item_id = None
         price = None
@@ -113,23 +256,7 @@ class BunertScraper(BaseScraper):
             currency = "EUR"
 
         if not name:
-            try:
-                title = await page.title()
-                name = (title or "").split("|")[0].strip() or None
-            except Exception:
-                name = None
-
-        image_url = await page.get_attribute('meta[property="og:image"]', "content")
-        if image_url:
-            image_url = urljoin(page.url, image_url)
-
-        image_bytes = None
-        image_mime = None
-        if image_url:
-            try:
-                image_bytes, image_mime = await self._fetch_image(page, image_url)
-            except Exception as e:
-                print(f"[{self.name}] Failed to fetch image: {e}")
+            name = (title or "").split("|")[0].strip() or None
 
         if not name:
             return []
@@ -139,10 +266,9 @@ class BunertScraper(BaseScraper):
                 name=name,
                 price=price,
                 currency=currency,
-                url=page.url,
+                url=url,
                 item_id=item_id,
-                image=image_bytes,
+                image=image,
                 image_mime=image_mime,
             )
         ]
-
@@ -5,14 +5,23 @@ from __future__ import annotations
 import asyncio
 from datetime import UTC, datetime
 from typing import Any
-from urllib.parse import urlencode, urljoin
+from urllib.parse import urljoin
 
 import httpx
+import orjson
 from playwright.async_api import Page
 
 from ..models import Product, ScrapeResult
 from ..utils import parse_price
 from .base import BaseScraper
+from .image_cache import cached_fetch, fetch_image
+
+_IMAGE_HEADERS = {
+    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+    "Sec-Fetch-Dest": "image",
+    "Sec-Fetch-Mode": "no-cors",
+    "Sec-Fetch-Site": "cross-site",
+}
 
 
 class CardioFitnessScraper(BaseScraper):
@@ -24,6 +33,9 @@ class CardioFitnessScraper(BaseScraper):
 
     _BASE = "https://www.cardiofitness.de/"
     _COLLECTION_PRODUCTS_JSON = "https://www.cardiofitness.de/collections/blackroll/products.json"
+    _PAGE_SIZE = 250
+    _MAX_PAGES = 20
+    _PAGE_BATCH = 4
 
     async def scrape(self) -> ScrapeResult:
         products = await self._scrape_shopify_collection_products_json()
@@ -85,6 +97,31 @@ class CardioFitnessScraper(BaseScraper):
             return first.strip()
         return None
 
+    async def _fetch_page(self, client: httpx.AsyncClient, page_num: int) -> list:
+        page_url = f"{self._COLLECTION_PRODUCTS_JSON}?limit={self._PAGE_SIZE}&page={page_num}"
+        resp = await client.get(page_url)
+        resp.raise_for_status()
+        payload = orjson.loads(resp.content)
+        raw_products = payload.get("products") if isinstance(payload, dict) else None
+        return raw_products if isinstance(raw_products, list) else []
+
+    async def _fetch_raw_products(self, client: httpx.AsyncClient) -> list:
+        """Fetch collection pages in concurrent batches until a short or empty page marks the end."""
+        print(f"[{self.name}] Loading {self._COLLECTION_PRODUCTS_JSON}...")
+        all_items: list = []
+        pages_used = 0
+        for start in range(1, self._MAX_PAGES + 1, self._PAGE_BATCH):
+            page_nums = range(start, min(start + self._PAGE_BATCH, self._MAX_PAGES + 1))
+            pages = await asyncio.gather(*(self._fetch_page(client, n) for n in page_nums))
+            for items in pages:
+                pages_used += 1
+                all_items.extend(items)
+                if len(items) < self._PAGE_SIZE:
+                    print(f"[{self.name}] Loaded {len(all_items)} items from {pages_used} page(s)")
+                    return all_items
+        print(f"[{self.name}] Loaded {len(all_items)} items from {pages_used} page(s)")
+        return all_items
+
     async def _scrape_shopify_collection_products_json(self) -> list[Product]:
         headers = {
             "user-agent": (
@@ -97,68 +134,69 @@ class CardioFitnessScraper(BaseScraper):
 
         timeout = httpx.Timeout(60.0)
         products: list[Product] = []
+        products_by_id: dict[str, Product] = {}
         image_urls: dict[str, str] = {}
         seen: set[str] = set()
 
-        async with httpx.AsyncClient(headers=headers, follow_redirects=True, timeout=timeout) as client:
-            page_num = 1
-            while True:
-                page_url = f"{self._COLLECTION_PRODUCTS_JSON}?{urlencode({'limit': 250, 'page': page_num})}"
-                print(f"[{self.name}] Loading {page_url}...")
-                resp = await client.get(page_url)
-                resp.raise_for_status()
-                payload = resp.json()
-                raw_products = payload.get("products")
-                if not isinstance(raw_products, list) or not raw_products:
-                    break
-
-                for raw in raw_products:
-                    if not isinstance(raw, dict):
-                        continue
-
-                    item_id = raw.get("id")
-                    item_id_str = str(item_id) if item_id is not None else None
-                    if item_id_str and item_id_str in seen:
-                        continue
-                    if item_id_str:
-                        seen.add(item_id_str)
-
-                    name = self._coerce_str(raw.get("title"))
-                    handle = self._coerce_str(raw.get("handle"))
-                    url = self._product_url(handle)
-
-                    variant = self._pick_variant(raw) or {}
-                    price = self._coerce_price(variant.get("price"))
-                    currency = "EUR" if price is not None else None
-
-                    if item_id_str:
-                        if image_url := self._pick_image_url(raw):
-                            image_urls[item_id_str] = image_url
-
-                    if not name:
-                        continue
-
-                    products.append(
-                        Product(
-                            name=name,
-                            price=price,
-                            currency=currency,
-                            url=url,
-                            item_id=item_id_str,
-                        )
-                    )
-
-                page_num += 1
+        # JSON and images come from the same host, so HTTP/2 multiplexes the fan-out on one connection.
+        async with httpx.AsyncClient(
+            headers=headers,
+            http2=True,
+            follow_redirects=True,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        ) as client:
+            raw_products = await self._fetch_raw_products(client)
+            for raw in raw_products:
+                if not isinstance(raw, dict):
+                    continue
+
+                item_id = raw.get("id")
+                item_id_str = str(item_id) if item_id is not None else None
+                if item_id_str and item_id_str in seen:
+                    continue
+                if item_id_str:
+                    seen.add(item_id_str)
+
+                name = self._coerce_str(raw.get("title"))
+                handle = self._coerce_str(raw.get("handle"))
+                url = self._product_url(handle)
+
+                variant = self._pick_variant(raw) or {}
+                price = self._coerce_price(variant.get("price"))
+                currency = "EUR" if price is not None else None
+
+                if item_id_str:
+                    if image_url := self._pick_image_url(raw):
+                        image_urls[item_id_str] = image_url
+
+                if not name:
+                    continue
+
+                product = Product(
+                    name=name,
+                    price=price,
+                    currency=currency,
+                    url=url,
+                    item_id=item_id_str,
+                )
+                products.append(product)
+                if item_id_str:
+                    products_by_id[item_id_str] = product
 
             if not products:
                 return []
 
-            semaphore = asyncio.Semaphore(8)
+            semaphore = asyncio.Semaphore(16)
 
-            async def fetch_image(item_id: str, image_url: str) -> tuple[str, bytes | None, str | None]:
+            async def download(image_url: str) -> tuple[bytes | None, str | None]:
                 async with semaphore:
-                    body, mime = await self._fetch_image(client, referer=self.url, image_url=image_url)
-                    return item_id, body, mime
+                    return await self._fetch_image(client, referer=self.url, image_url=image_url)
+
+            async def fetch_image(item_id: str, image_url: str) -> tuple[str, bytes | None, str | None]:
+                # Variants often share a hero image; cached_fetch downloads each URL once.
+                body, mime = await cached_fetch(image_url, download)
+                return item_id, body, mime
 
             tasks = [
                 fetch_image(item_id, img_url)
@@ -167,21 +205,13 @@ class CardioFitnessScraper(BaseScraper):
             ]
             results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            images_by_id: dict[str, tuple[bytes | None, str | None]] = {}
             for idx, r in enumerate(results):
                 if isinstance(r, Exception):
                     print(f"[{self.name}] Image fetch error {idx}: {r}")
                     continue
                 item_id, body, mime = r
-                if body and mime:
-                    images_by_id[item_id] = (body, mime)
-
-        for p in products:
-            if not p.item_id:
-                continue
-            image = images_by_id.get(p.item_id)
-            if image:
-                p.image, p.image_mime = image
+                if body and mime and (p := products_by_id.get(item_id)):
+                    p.image, p.image_mime = body, mime
 
         return products
 
@@ -192,28 +222,4 @@ class CardioFitnessScraper(BaseScraper):
         referer: str,
         image_url: str,
     ) -> tuple[bytes | None, str | None]:
-        try:
-            resp = await client.get(
-                image_url,
-                timeout=httpx.Timeout(30.0),
-                headers={
-                    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
-                    "Referer": referer,
-                    "Sec-Fetch-Dest": "image",
-                    "Sec-Fetch-Mode": "no-cors",
-                    "Sec-Fetch-Site": "cross-site",
-                },
-            )
-            if resp.status_code >= 400:
-                return None, None
-            body = resp.content
-            if not body or len(body) < 800:
-                return None, None
-            mime = resp.headers.get("content-type")
-            if mime and ";" in mime:
-                mime = mime.split(";", 1)[0].strip()
-            if mime and not mime.startswith("image/"):
-                return None, None
-            return body, mime
-        except Exception:
-            return None, None
+        return await fetch_image(client, image_url, headers={**_IMAGE_HEADERS, "Referer": referer})
@@ -7,12 +7,16 @@ import re
 from datetime import UTC, datetime
 from urllib.parse import urljoin
 
+import httpx
 from playwright.async_api import Page
 
 from ..models import Product, ScrapeResult
 from ..utils import parse_price
-from .base import BaseScraper
+from .base import BaseScraper, click_first_visible
 from .browser_pool import get_browser_context
+from .http_client import image_client_from_context
+from .image_cache import cached_fetch, fetch_image
+from .urlutils import is_avif
 
 _DESKTOP_UA = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -25,6 +29,28 @@ Object.defineProperty(navigator, 'languages', { get: () => ['de-CH', 'de', 'en']
 Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
 """.strip()
 
+# One srcset candidate: URL plus optional `<n>w` / `<n>x` descriptor.
+_SRCSET_CANDIDATE_RE = re.compile(r"([^\s,]+)(?:\s+(\d+(?:\.\d+)?)([wxWX]))?[^,]*(?:,|$)")
+_R_P_ITEM_ID_RE = re.compile(r"/R-p-([0-9a-fA-F-]{8,})")
+_MC_PARAM_RE = re.compile(r"[?&]mc=([^&#]+)")
+
+_CONSENT_SELECTORS = (
+    "#didomi-notice-agree-button",
+    'button:has-text("Annehmen und Schliessen")',
+    'button:has-text("Accept all")',
+    'button:has-text("Accept")',
+    'button:has-text("Alle akzeptieren")',
+    'button:has-text("Allem zustimmen")',
+    "#onetrust-accept-btn-handler",
+    '[data-testid="uc-accept-all-button"]',
+)
+
+_IMAGE_HEADERS = {
+    "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
+    "Sec-Fetch-Dest": "image",
+    "Sec-Fetch-Mode": "no-cors",
+}
+
 
 class DecathlonCHScraper(BaseScraper):
     name = "decathlon_ch"
@@ -46,6 +72,7 @@ class DecathlonCHScraper(BaseScraper):
             locale=self.locale,
             viewport=self.viewport,
             init_scripts=self.init_scripts,
+            block_resources=self.block_resources,
         ) as context:
             page = await context.new_page()
             print(f"[{self.name}] Loading {self.url}...")
@@ -59,7 +86,7 @@ class DecathlonCHScraper(BaseScraper):
             key = product.item_id or product.url or product.name
             if not key:
                 continue
-            deduped[key] = product
+            deduped.setdefault(key, product)
 
         final_products = list(deduped.values())
         print(f"[{self.name}] Extracted {len(final_products)} products")
@@ -72,24 +99,8 @@ class DecathlonCHScraper(BaseScraper):
         )
 
     async def _handle_cookie_consent(self, page: Page) -> None:
-        for selector in [
-            "#didomi-notice-agree-button",
-            'button:has-text("Annehmen und Schliessen")',
-            'button:has-text("Accept all")',
-            'button:has-text("Accept")',
-            'button:has-text("Alle akzeptieren")',
-            'button:has-text("Allem zustimmen")',
-            "#onetrust-accept-btn-handler",
-            '[data-testid="uc-accept-all-button"]',
-        ]:
-            try:
-                btn = await page.query_selector(selector)
-                if btn and await btn.is_visible():
-                    await btn.click()
-                    await page.wait_for_timeout(600)
-                    return
-            except Exception:
-                continue
+        if await click_first_visible(page, _CONSENT_SELECTORS):
+            await page.wait_for_timeout(600)
 
     async def _wait_for_products(self, page: Page) -> None:
         await page.wait_for_selector('article:has(a[href*="/p/"])', timeout=60000, state="attached")
@@ -99,40 +110,27 @@ class DecathlonCHScraper(BaseScraper):
     def _pick_srcset_url(srcset: str | None) -> str | None:
         if not srcset or not isinstance(srcset, str):
             return None
-        candidates: list[tuple[int, str]] = []
-        for part in [p.strip() for p in srcset.split(",") if p.strip()]:
-            chunks = part.split()
-            if not chunks:
-                continue
-            url = chunks[0].strip()
-            if not url:
-                continue
-            score = 0
-            if len(chunks) >= 2:
-                hint = chunks[1].strip().lower()
-                if hint.endswith("w"):
-                    try:
-                        score = int(re.sub(r"[^0-9]", "", hint) or "0")
-                    except Exception:
-                        score = 0
-                elif hint.endswith("x"):
-                    try:
-                        score = int(float(hint[:-1]) * 1000)
-                    except Exception:
-                        score = 0
-            candidates.append((score, url))
-        if not candidates:
-            return None
-        candidates.sort(key=lambda t: t[0])
-        return candidates[-1][1]
+        best: tuple[bool, float] | None = None
+        best_url: str | None = None
+        for match in _SRCSET_CANDIDATE_RE.finditer(srcset):
+            url, size, unit = match.groups()
+            score = 0.0
+            if size:
+                score = float(size) * (1000 if unit.lower() == "x" else 1)
+            # Largest candidate wins, but any non-AVIF candidate beats an AVIF one;
+            # on ties the later candidate wins.
+            rank = (not is_avif(url), score)
+            if best is None or rank >= best:
+                best, best_url = rank, url
+        return best_url
 
     @staticmethod
     def _extract_item_id(product_url: str | None) -> str | None:
         if not product_url:
             return None
-        if match := re.search(r"/R-p-([0-9a-fA-F-]{8,})", product_url):
+        if match := _R_P_ITEM_ID_RE.search(product_url):
             return match.group(1)
-        if match := re.search(r"[?&]mc=([^&#]+)", product_url):
+        if match := _MC_PARAM_RE.search(product_url):
             return match.group(1)
         return None
 
@@ -149,35 +147,14 @@ class DecathlonCHScraper(BaseScraper):
         return url
 
     async def _fetch_image(
-        self, page: Page, image_url: str | None, *, referer: str
+        self, client: httpx.AsyncClient, image_url: str | None, *, referer: str
     ) -> tuple[bytes | None, str | None]:
         image_url = self._normalize_url(image_url)
-        if not image_url:
-            return None, None
-
-        try:
-            resp = await page.context.request.get(
-                image_url,
-                headers={
-                    # Avoid requesting AVIF; Pillow cannot reliably decode it here.
-                    "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
-                    "Referer": referer,
-                    "Sec-Fetch-Dest": "image",
-                    "Sec-Fetch-Mode": "no-cors",
-                },
-                timeout=30000,
-            )
-            if not resp.ok:
-                return None, None
-            body = await resp.body()
-            if len(body) < 800:
-                return None, None
-            mime = resp.headers.get("content-type")
-            if mime and ";" in mime:
-                mime = mime.split(";", 1)[0].strip()
-            return body, mime
-        except Exception:
+        if not image_url or is_avif(image_url):
             return None, None
+        # Pillow cannot reliably decode AVIF here: don't ask for it, and drop it if served anyway.
+        headers = {**_IMAGE_HEADERS, "Referer": referer}
+        return await fetch_image(client, image_url, headers=headers, skip_mimes=frozenset({"image/avif"}))
 
     async def extract_products(self, page: Page) -> list[Product]:
         items = await page.eval_on_selector_all(
@@ -200,6 +177,7 @@ class DecathlonCHScraper(BaseScraper):
             return []
 
         parsed: list[dict] = []
+        seen: set[str] = set()
         for raw in items:
             if not isinstance(raw, dict):
                 continue
@@ -215,8 +193,14 @@ class DecathlonCHScraper(BaseScraper):
             srcset = raw.get("srcset") if isinstance(raw.get("srcset"), str) else None
             if srcset:
                 image_url = self._pick_srcset_url(srcset)
-            if not image_url:
-                image_url = raw.get("imgUrl") if isinstance(raw.get("imgUrl"), str) else None
+            if not image_url or is_avif(image_url):
+                image_url = raw.get("imgUrl") if isinstance(raw.get("imgUrl"), str) else image_url
+
+            # Skip repeated tiles before any image is fetched for them.
+            item_id = self._extract_item_id(product_url) or clean_url
+            if item_id in seen:
+                continue
+            seen.add(item_id)
 
             price_text = raw.get("priceText") if isinstance(raw.get("priceText"), str) else None
             amount, currency = parse_price(price_text)
@@ -224,7 +208,7 @@ class DecathlonCHScraper(BaseScraper):
                 {
                     "name": name,
                     "url": clean_url,
-                    "item_id": self._extract_item_id(product_url) or clean_url,
+                    "item_id": item_id,
                     "price": amount,
                     "currency": currency or self._default_currency,
                     "image_url": image_url,
@@ -233,21 +217,36 @@ class DecathlonCHScraper(BaseScraper):
 
         semaphore = asyncio.Semaphore(6)
 
-        async def build_product(entry: dict) -> Product | None:
-            async with semaphore:
-                image_bytes, image_mime = await self._fetch_image(
-                    page, entry.get("image_url"), referer=entry["url"]
-                )
-            return Product(
-                name=entry["name"],
-                price=entry.get("price"),
-                currency=entry.get("currency"),
-                url=entry.get("url"),
-                item_id=entry.get("item_id"),
-                image=image_bytes,
-                image_mime=image_mime,
-            )
+        async def fetch_image(client: httpx.AsyncClient, entry: dict) -> tuple[bytes | None, str | None]:
+            async def download(image_url: str) -> tuple[bytes | None, str | None]:
+                async with semaphore:
+                    return await self._fetch_image(client, image_url, referer=entry["url"])
 
-        products = await asyncio.gather(*(build_product(e) for e in parsed))
-        return [p for p in products if p is not None]
+            # Identical image URLs share one download and one bytes object.
+            return await cached_fetch(self._normalize_url(entry.get("image_url")), download)
 
+        # Images are static CDN files; fetch them directly rather than through the browser.
+        async with await image_client_from_context(
+            page.context,
+            user_agent=self.user_agent,
+            # Most CDN images arrive within a couple of seconds; a stalled request times out
+            # and its product is kept without an image.
+            timeout=8.0,
+            max_keepalive_connections=8,
+        ) as client:
+            images = await asyncio.gather(*(fetch_image(client, e) for e in parsed))
+
+        products: list[Product] = []
+        for entry, (image_bytes, image_mime) in zip(parsed, images):
+            products.append(
+                Product(
+                    name=entry["name"],
+                    price=entry.get("price"),
+                    currency=entry.get("currency"),
+                    url=entry.get("url"),
+                    item_id=entry.get("item_id"),
+                    image=image_bytes,
+                    image_mime=image_mime,
+                )
+            )
+        return products
@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 from urllib.parse import urljoin
 
+import orjson
 from playwright.async_api import Page
 
 from ..models import Product
 from ..utils import parse_price
 from .base import BaseScraper
+from .http_client import image_client_from_context
+
+# Image request headers as a browser sends them for an <img> on the shop page.
+_IMAGE_HEADERS = {
+    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+    "Sec-Fetch-Dest": "image",
+    "Sec-Fetch-Mode": "no-cors",
+    "Sec-Fetch-Site": "cross-site",
+}
 
 
 class DeinVitalShopScraper(BaseScraper):
@@ -31,117 +42,103 @@ class DeinVitalShopScraper(BaseScraper):
     _base_url = "https://dein-vital.shop"
     _collection_products_json = "https://dein-vital.shop/collections/blackroll/products.json?limit=250&page={page}"
     _currency = "EUR"
+    _PAGE_SIZE = 250
+    _MAX_PAGES = 50
+    _PAGE_BATCH = 4
 
     @staticmethod
-    def _pick_best_image_url(images: list[dict] | None) -> str | None:
+    def _safe_width(img: dict) -> int:
+        try:
+            return int(img.get("width") or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    @classmethod
+    def _pick_best_image_url(cls, images: list[dict] | None) -> str | None:
         if not images:
             return None
-        best = None
-        for img in images:
-            if not isinstance(img, dict):
-                continue
-            src = img.get("src")
-            if not isinstance(src, str) or not src.strip():
-                continue
-            if best is None:
-                best = img
+        candidates = [
+            img for img in images if isinstance(img, dict) and isinstance(img.get("src"), str) and img["src"].strip()
+        ]
+        # Reversed so that, as before, the last of equally wide images wins.
+        best = max(reversed(candidates), key=cls._safe_width, default=None)
+        return best["src"] if best else None
+
+    async def _fetch_page(self, page: Page, page_num: int) -> list | None:
+        """Return the products on one collection page, or None if the request failed."""
+        resp = await page.context.request.get(
+            self._collection_products_json.format(page=page_num),
+            headers={"Accept": "application/json", "Referer": self.url},
+            timeout=45000,
+        )
+        if not resp.ok:
+            return None
+        payload = orjson.loads(await resp.body())
+        items = payload.get("products") if isinstance(payload, dict) else None
+        return items if isinstance(items, list) else []
+
+    async def _fetch_items(self, page: Page) -> list:
+        # The collection usually fits on one page, so probe page 1 alone before
+        # speculating on further pages concurrently.
+        first = await self._fetch_page(page, 1)
+        if not first or len(first) < self._PAGE_SIZE:
+            return first or []
+
+        all_items: list = list(first)
+        for start in range(2, self._MAX_PAGES + 1, self._PAGE_BATCH):
+            page_nums = range(start, min(start + self._PAGE_BATCH, self._MAX_PAGES + 1))
+            pages = await asyncio.gather(*(self._fetch_page(page, n) for n in page_nums))
+            for items in pages:
+                if items is None:
+                    return all_items
+                all_items.extend(items)
+                if len(items) < self._PAGE_SIZE:
+                    return all_items
+        return all_items
+
+    async def extract_products(self, page: Page) -> list[Product]:
+        parsed: list[dict] = []
+        for item in await self._fetch_items(page):
+            if not isinstance(item, dict):
                 continue
-            try:
-                if int(img.get("width") or 0) >= int(best.get("width") or 0):
-                    best = img
-            except Exception:
+
+            title = item.get("title")
+            if not isinstance(title, str) or not title.strip():
                 continue
-        if best and isinstance(best.get("src"), str):
-            return best["src"]
-        return None
+            item_id = item.get("id")
+            item_id_str = str(item_id) if item_id is not None else None
 
-    async def _fetch_image(self, page: Page, image_url: str) -> tuple[bytes | None, str | None]:
-        try:
-            resp = await page.context.request.get(
-                image_url,
-                headers={
-                    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
-                    "Referer": self.url,
-                    "Sec-Fetch-Dest": "image",
-                    "Sec-Fetch-Mode": "no-cors",
-                    "Sec-Fetch-Site": "cross-site",
-                },
-                timeout=30000,
+            handle = item.get("handle")
+            product_url = (
+                urljoin(self._base_url, f"/products/{handle}") if isinstance(handle, str) and handle else None
             )
-            if not resp.ok:
-                return None, None
-            body = await resp.body()
-            if len(body) < 800:
-                return None, None
-            mime = resp.headers.get("content-type")
-            if mime and ";" in mime:
-                mime = mime.split(";", 1)[0].strip()
-            return body, mime
-        except Exception:
-            return None, None
 
-    async def extract_products(self, page: Page) -> list[Product]:
-        products: list[Product] = []
-
-        for page_num in range(1, 51):
-            api_url = self._collection_products_json.format(page=page_num)
-            resp = await page.context.request.get(
-                api_url,
-                headers={"Accept": "application/json", "Referer": self.url},
-                timeout=45000,
+            price: float | None = None
+            variants = item.get("variants")
+            if isinstance(variants, list) and variants:
+                prices: list[float] = []
+                for v in variants:
+                    if not isinstance(v, dict):
+                        continue
+                    p, _ = parse_price(v.get("price"))
+                    if p is not None:
+                        prices.append(p)
+                if prices:
+                    price = min(prices)
+
+            parsed.append(
+                {
+                    "name": title.strip(),
+                    "price": price,
+                    "currency": self._currency,
+                    "url": product_url,
+                    "item_id": item_id_str,
+                    "image_url": self._pick_best_image_url(item.get("images")),
+                }
             )
-            if not resp.ok:
-                break
-            payload = await resp.json()
-            items = payload.get("products") if isinstance(payload, dict) else None
-            if not isinstance(items, list) or not items:
-                break
-
-            for item in items:
-                if not isinstance(item, dict):
-                    continue
-
-                title = item.get("title")
-                if not isinstance(title, str) or not title.strip():
-                    continue
-                item_id = item.get("id")
-                item_id_str = str(item_id) if item_id is not None else None
-
-                handle = item.get("handle")
-                product_url = (
-                    urljoin(self._base_url, f"/products/{handle}") if isinstance(handle, str) and handle else None
-                )
-
-                price: float | None = None
-                variants = item.get("variants")
-                if isinstance(variants, list) and variants:
-                    prices: list[float] = []
-                    for v in variants:
-                        if not isinstance(v, dict):
-                            continue
-                        p, _ = parse_price(v.get("price"))
-                        if p is not None:
-                            prices.append(p)
-                    if prices:
-                        price = min(prices)
-
-                image_url = self._pick_best_image_url(item.get("images"))
-                image_bytes = None
-                image_mime = None
-                if image_url:
-                    image_bytes, image_mime = await self._fetch_image(page, image_url)
-
-                products.append(
-                    Product(
-                        name=title.strip(),
-                        price=price,
-                        currency=self._currency,
-                        url=product_url,
-                        item_id=item_id_str,
-                        image=image_bytes,
-                        image_mime=image_mime,
-                    )
-                )
-
-        return products
 
+        headers = {**_IMAGE_HEADERS, "Referer": self.url}
+        async with await image_client_from_context(
+            page.context, user_agent=self.user_agent, max_keepalive_connections=8
+        ) as client:
+            return await self.build_products(client, parsed, headers=headers)
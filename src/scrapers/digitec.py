@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from datetime import UTC, datetime
-from urllib.parse import urljoin
 
 from playwright.async_api import Page
 
 from ..models import Product, ScrapeResult
 from ..utils import parse_price
-from .base import BaseScraper
-from .browser_pool import get_browser_context
+from .base import BaseScraper, click_first_visible
+from .browser_pool import DEFAULT_BLOCKED_RESOURCES, get_browser_context
+from .image_cache import cached_fetch
+from .urlutils import is_avif, normalize
 
 
 _DESKTOP_UA = (
@@ -25,6 +27,93 @@ Object.defineProperty(navigator, 'languages', { get: () => ['en-US', 'en'] });
 Object.defineProperty(navigator, 'plugins', { get: () => [1, 2, 3, 4, 5] });
 """.strip()
 
+_BRAND_ID_RE = re.compile(r"-(\d{3,})/?$")
+_ITEM_ID_RE = re.compile(r"-(\d{6,})(?:\?|$|/|#)")
+
+_SHOW_MORE_SELECTORS = (
+    'button:has-text("Show more")',
+    'button:has-text("Load more")',
+    'button:has-text("More")',
+    'button:has-text("Mehr anzeigen")',
+)
+
+# Whole "load all" loop in one evaluate: each round clicks the first visible show-more
+# button, scrolls to the bottom, waits for the product count to grow and then to stay
+# quiet for `quietMs`. A clicked button gets up to `roundTimeoutMs` to deliver; without
+# one, only `quietMs` for scroll-triggered loading. Stops at the first round that adds
+# nothing.
+_LOAD_ALL_PRODUCTS_JS = """
+async ({selector, buttons, maxRounds, quietMs, roundTimeoutMs}) => {
+  const count = () => document.querySelectorAll(selector).length;
+  const visible = el => {
+    const r = el.getBoundingClientRect();
+    return r.width > 0 && r.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+  };
+  const findButton = () => {
+    for (const sel of buttons) {
+      const m = sel.match(/^(.*):has-text\\("(.*)"\\)$/);
+      let els;
+      try {
+        els = Array.from(document.querySelectorAll(m ? (m[1] || '*') : sel));
+      } catch (e) {
+        continue;
+      }
+      if (m) {
+        const needle = m[2].toLowerCase();
+        els = els.filter(el => (el.textContent || '').toLowerCase().includes(needle));
+      }
+      if (els.length && visible(els[0])) return els[0];
+    }
+    return null;
+  };
+  // Waits (bounded by timeoutMs) for the count to grow past `before`; only then does
+  // the quiet window start, so a slow "show more" response is not mistaken for the end.
+  const settle = (before, timeoutMs) => new Promise(resolve => {
+    let last = before;
+    let quiet = null;
+    let hard = null;
+    const check = () => {
+      const now = count();
+      if (now > before && now !== last) {
+        last = now;
+        clearTimeout(quiet);
+        quiet = setTimeout(done, quietMs);
+      }
+    };
+    const observer = new MutationObserver(check);
+    function done() {
+      observer.disconnect();
+      clearTimeout(quiet);
+      clearTimeout(hard);
+      resolve(count());
+    }
+    observer.observe(document.body, {childList: true, subtree: true});
+    hard = setTimeout(done, timeoutMs);
+    check();
+  });
+
+  let n = count();
+  for (let i = 0; i < maxRounds; i++) {
+    const before = n;
+    const button = findButton();
+    if (button) button.click();
+    window.scrollTo(0, document.body.scrollHeight);
+    n = await settle(before, button ? roundTimeoutMs : quietMs);
+    if (n <= before) break;
+  }
+  return n;
+}
+"""
+
+_CONSENT_SELECTORS = (
+    'button:has-text("Accept all")',
+    'button:has-text("Accept")',
+    'button:has-text("Alle akzeptieren")',
+    'button:has-text("Allem zustimmen")',
+    "#onetrust-accept-btn-handler",
+    '[data-testid="uc-accept-all-button"]',
+)
+
 
 class DigitecScraper(BaseScraper):
     name = "digitec_ch"
@@ -36,17 +125,29 @@ class DigitecScraper(BaseScraper):
     locale = "en-CH"
     viewport = {"width": 1920, "height": 1080}
     init_scripts = [_STEALTH_INIT_SCRIPT]
+    # Extraction only reads image URLs from the DOM and downloads go through
+    # `context.request`, which page routing does not intercept, so images can be aborted.
+    block_resources = DEFAULT_BLOCKED_RESOURCES | {"image"}
 
     _base_url = "https://www.digitec.ch"
 
-    async def scrape(self) -> ScrapeResult:
-        async with get_browser_context(
+    # Listings scraped concurrently, each in its own pooled browser context.
+    _LISTING_CONCURRENCY = 3
+
+    def _context(self):
+        return get_browser_context(
             browser_type=self.browser_type,
             user_agent=self.user_agent,
             locale=self.locale,
             viewport=self.viewport,
             init_scripts=self.init_scripts,
-        ) as context:
+            block_resources=self.block_resources,
+        )
+
+    async def scrape(self) -> ScrapeResult:
+        # The brand page context is released before fanning out so listing contexts
+        # never wait on a pool slot held by this scrape.
+        async with self._context() as context:
             page = await context.new_page()
             print(f"[{self.name}] Loading {self.url}...")
             await page.goto(self.url, wait_until="domcontentloaded", timeout=90000)
@@ -57,21 +158,24 @@ class DigitecScraper(BaseScraper):
             if not listing_urls:
                 listing_urls = [self.url]
 
-            products: list[Product] = []
-            for idx, listing_url in enumerate(listing_urls):
+        semaphore = asyncio.Semaphore(self._LISTING_CONCURRENCY)
+        # Shared across listings: a product repeated under several filters is built once.
+        seen: set[str] = set()
+
+        async def bounded(idx: int, listing_url: str) -> list[Product]:
+            async with semaphore:
                 print(f"[{self.name}] Loading listing {idx + 1}/{len(listing_urls)}: {listing_url}")
-                await page.goto(listing_url, wait_until="domcontentloaded", timeout=90000)
-                await self._handle_cookie_consent(page)
-                await self._wait_for_products(page)
-                await self._load_all_products(page)
-                products.extend(await self.extract_products(page))
+                return await self._scrape_listing(listing_url, seen)
+
+        results = await asyncio.gather(*(bounded(i, u) for i, u in enumerate(listing_urls)))
+        products = [product for listing in results for product in listing]
 
         deduped: dict[str, Product] = {}
         for product in products:
             key = product.item_id or product.url or product.name
             if not key:
                 continue
-            deduped[key] = product
+            deduped.setdefault(key, product)
 
         final_products = list(deduped.values())
         print(f"[{self.name}] Extracted {len(final_products)} products")
@@ -83,11 +187,20 @@ class DigitecScraper(BaseScraper):
             products=final_products,
         )
 
+    async def _scrape_listing(self, listing_url: str, seen: set[str]) -> list[Product]:
+        async with self._context() as context:
+            page = await context.new_page()
+            await page.goto(listing_url, wait_until="domcontentloaded", timeout=90000)
+            await self._handle_cookie_consent(page)
+            await self._wait_for_products(page)
+            await self._load_all_products(page)
+            return await self.extract_products(page, seen=seen)
+
     @staticmethod
     def _extract_brand_id_from_url(url: str) -> str | None:
         if not url:
             return None
-        if match := re.search(r"-(\d{3,})/?$", url):
+        if match := _BRAND_ID_RE.search(url):
             return match.group(1)
         return None
 
@@ -96,50 +209,23 @@ class DigitecScraper(BaseScraper):
         if not brand_id:
             return []
 
+        wanted = f"filter=bra%3D{brand_id}"
+        # Filter in the page so only matching hrefs cross the protocol boundary.
         hrefs = await page.eval_on_selector_all(
             "a[href]",
-            "els => els.map(a => a.getAttribute('href')).filter(Boolean)",
+            """(els, wanted) => els
+                .map(a => (a.getAttribute('href') || '').trim())
+                .filter(h => h.includes('/producttype/') && h.includes(wanted))""",
+            wanted,
         )
         if not isinstance(hrefs, list):
             return []
 
-        wanted = f"filter=bra%3D{brand_id}"
-        urls: list[str] = []
-        seen: set[str] = set()
-        for href in hrefs:
-            if not isinstance(href, str):
-                continue
-            h = href.strip()
-            if not h:
-                continue
-            if "/producttype/" not in h:
-                continue
-            if wanted not in h:
-                continue
-            absolute = urljoin(self._base_url, h)
-            if absolute in seen:
-                continue
-            seen.add(absolute)
-            urls.append(absolute)
-        return urls
+        return list(dict.fromkeys(normalize(h, base=self._base_url) for h in hrefs if isinstance(h, str) and h))
 
     async def _handle_cookie_consent(self, page: Page) -> None:
-        for selector in [
-            'button:has-text("Accept all")',
-            'button:has-text("Accept")',
-            'button:has-text("Alle akzeptieren")',
-            'button:has-text("Allem zustimmen")',
-            "#onetrust-accept-btn-handler",
-            '[data-testid="uc-accept-all-button"]',
-        ]:
-            try:
-                btn = await page.query_selector(selector)
-                if btn and await btn.is_visible():
-                    await btn.click()
-                    await page.wait_for_timeout(700)
-                    return
-            except Exception:
-                continue
+        if await click_first_visible(page, _CONSENT_SELECTORS):
+            await page.wait_for_timeout(700)
 
     async def _wait_for_products(self, page: Page) -> None:
         try:
@@ -149,42 +235,20 @@ class DigitecScraper(BaseScraper):
             return
 
     async def _load_all_products(self, page: Page) -> None:
-        stable_rounds = 0
-        last_count = -1
-        for _ in range(12):
-            try:
-                count = await page.locator('article a[href*="/product/"]').count()
-            except Exception:
-                count = 0
-
-            if count == last_count:
-                stable_rounds += 1
-            else:
-                stable_rounds = 0
-            last_count = count
-            if stable_rounds >= 2:
-                return
-
-            for selector in [
-                'button:has-text("Show more")',
-                'button:has-text("Load more")',
-                'button:has-text("More")',
-                'button:has-text("Mehr anzeigen")',
-            ]:
-                try:
-                    btn = await page.query_selector(selector)
-                    if btn and await btn.is_visible():
-                        await btn.click()
-                        await page.wait_for_timeout(1000)
-                        break
-                except Exception:
-                    continue
-
-            try:
-                await page.evaluate("() => window.scrollTo(0, document.body.scrollHeight)")
-            except Exception:
-                pass
-            await page.wait_for_timeout(1100)
+        try:
+            await page.evaluate(
+                _LOAD_ALL_PRODUCTS_JS,
+                {
+                    "selector": 'article a[href*="/product/"]',
+                    "buttons": list(_SHOW_MORE_SELECTORS),
+                    "maxRounds": 12,
+                    "quietMs": 800,
+                    "roundTimeoutMs": 5000,
+                },
+            )
+        except Exception:
+            # Navigation or a closed page mid-loop; extract whatever is loaded.
+            return
 
     @staticmethod
     def _pick_best_srcset_url(srcset: str | None) -> str | None:
@@ -202,23 +266,16 @@ class DigitecScraper(BaseScraper):
         return urls[-1] if urls else None
 
     async def _fetch_image(self, page: Page, image_url: str | None) -> tuple[bytes | None, str | None]:
-        if not image_url or not isinstance(image_url, str):
+        image_url = normalize(image_url, base=self._base_url)
+        if not image_url or is_avif(image_url):
             return None, None
 
-        image_url = image_url.strip()
-        if not image_url:
-            return None, None
-
-        if image_url.startswith("//"):
-            image_url = f"https:{image_url}"
-        elif image_url.startswith("/"):
-            image_url = urljoin(self._base_url, image_url)
-
         try:
             resp = await page.context.request.get(
                 image_url,
                 headers={
-                    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+                    # Avoid requesting AVIF; Pillow cannot reliably decode it here.
+                    "Accept": "image/webp,image/apng,image/*,*/*;q=0.8",
                     "Referer": page.url,
                     "Sec-Fetch-Dest": "image",
                     "Sec-Fetch-Mode": "no-cors",
@@ -239,62 +296,110 @@ class DigitecScraper(BaseScraper):
             print(f"[{self.name}] Failed to fetch image: {img_err}")
             return None, None
 
-    async def extract_products(self, page: Page) -> list[Product]:
-        products: list[Product] = []
+    async def extract_products(self, page: Page, *, seen: set[str] | None = None) -> list[Product]:
+        """Extract the listing's products; keys already in `seen` are skipped (and new ones added)."""
+        if seen is None:
+            seen = set()
+        # One round-trip for all articles instead of several per article.
+        items = await page.eval_on_selector_all(
+            "article",
+            """
+            els => els.map(el => {
+              const link = el.querySelector('a[href*="/product/"]');
+              if (!link) return null;
+              const img = el.querySelector('picture img') || el.querySelector('img');
+              const source = el.querySelector('picture source[srcset]');
+              const webpSource = el.querySelector('picture source[type="image/webp"][srcset]');
+              const priceEl = el.querySelector('[data-testid*="price" i], [class*="price" i]');
+              return {
+                name: link.getAttribute('aria-label'),
+                href: link.getAttribute('href'),
+                priceText: priceEl ? priceEl.textContent : null,
+                text: el.innerText,
+                imgSrc: img ? img.getAttribute('src') : null,
+                imgDataSrc: img ? img.getAttribute('data-src') : null,
+                imgSrcset: img ? img.getAttribute('srcset') : null,
+                imgDataSrcset: img ? img.getAttribute('data-srcset') : null,
+                sourceSrcset: source ? source.getAttribute('srcset') : null,
+                webpSrcset: webpSource ? webpSource.getAttribute('srcset') : null,
+              };
+            })
+            """,
+        )
+        if not isinstance(items, list):
+            return []
 
-        articles = await page.query_selector_all("article")
-        for idx, article in enumerate(articles):
+        parsed: list[dict] = []
+        for idx, raw in enumerate(items):
+            if not isinstance(raw, dict):
+                continue
             try:
-                link = await article.query_selector('a[href*="/product/"]')
-                if not link:
-                    continue
-
-                name = await link.get_attribute("aria-label")
+                name = raw.get("name")
                 if not name:
                     continue
                 name = name.replace("\xa0", " ").strip()
 
-                href = await link.get_attribute("href")
-                url = urljoin(self._base_url, href) if href else None
+                href = raw.get("href")
+                url = normalize(href, base=self._base_url)
 
                 item_id = None
-                if url and (match := re.search(r"-(\d{6,})(?:\\?|$|/|#)", url)):
+                if url and (match := _ITEM_ID_RE.search(url)):
                     item_id = match.group(1)
 
-                text = await article.inner_text()
-                price, currency = parse_price(" ".join(text.split()))
-
-                img_url = None
-                img_el = await article.query_selector("picture img") or await article.query_selector("img")
-                if img_el:
-                    img_url = (
-                        await img_el.get_attribute("src")
-                        or await img_el.get_attribute("data-src")
-                        or self._pick_best_srcset_url(await img_el.get_attribute("srcset"))
-                        or self._pick_best_srcset_url(await img_el.get_attribute("data-srcset"))
-                    )
-
-                if not img_url:
-                    source_el = await article.query_selector("picture source[srcset]")
-                    if source_el:
-                        img_url = self._pick_best_srcset_url(await source_el.get_attribute("srcset"))
-
-                image_bytes, image_mime = await self._fetch_image(page, img_url)
-
-                products.append(
-                    Product(
-                        name=name,
-                        price=price,
-                        currency=currency,
-                        url=url,
-                        item_id=item_id,
-                        image=image_bytes,
-                        image_mime=image_mime,
-                    )
+                # The dedicated price element is short and unambiguous; the whole tile text
+                # (delivery, stock, ratings) is only a fallback.
+                price, currency = parse_price(" ".join((raw.get("priceText") or "").split()))
+                if price is None:
+                    price, currency = parse_price(" ".join((raw.get("text") or "").split()))
+
+                # An explicit WebP <source> beats the <img> fallback, and AVIF is never picked.
+                candidates = (
+                    self._pick_best_srcset_url(raw.get("webpSrcset")),
+                    raw.get("imgSrc"),
+                    raw.get("imgDataSrc"),
+                    self._pick_best_srcset_url(raw.get("imgSrcset")),
+                    self._pick_best_srcset_url(raw.get("imgDataSrcset")),
+                    self._pick_best_srcset_url(raw.get("sourceSrcset")),
                 )
+                img_url = next((u for u in candidates if u and not is_avif(u)), None)
             except Exception as exc:
                 print(f"[{self.name}] Error extracting product {idx}: {exc}")
                 continue
 
-        return products
+            # Skip duplicates before their image is fetched.
+            key = item_id or url or name
+            if key in seen:
+                continue
+            seen.add(key)
+
+            parsed.append(
+                {
+                    "name": name,
+                    "price": price,
+                    "currency": currency,
+                    "url": url,
+                    "item_id": item_id,
+                    "image_url": img_url,
+                }
+            )
+
+        semaphore = asyncio.Semaphore(6)
+
+        async def download(image_url: str) -> tuple[bytes | None, str | None]:
+            async with semaphore:
+                return await self._fetch_image(page, image_url)
+
+        async def build_product(entry: dict) -> Product:
+            # Identical image URLs share one download and one bytes object.
+            image_bytes, image_mime = await cached_fetch(entry["image_url"], download)
+            return Product(
+                name=entry["name"],
+                price=entry["price"],
+                currency=entry["currency"],
+                url=entry["url"],
+                item_id=entry["item_id"],
+                image=image_bytes,
+                image_mime=image_mime,
+            )
 
+        return list(await asyncio.gather(*(build_product(e) for e in parsed)))
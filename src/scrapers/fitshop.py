@@ -6,12 +6,26 @@ import re
 from datetime import datetime, UTC
 from urllib.parse import urljoin, urlparse
 
+from bs4 import BeautifulSoup
 from playwright.async_api import Page
 
 from ..models import Product, ScrapeResult
 from ..utils import parse_price
-from .base import BaseScraper
-from .browser_pool import get_browser_context
+from .base import BaseScraper, click_first_visible, scroll_through
+from .browser_pool import DEFAULT_BLOCKED_RESOURCES, get_browser_context
+from .http_cache import DEFAULT_CACHE_DIR, cache_enabled
+from .http_client import image_client_from_context, shared_client
+from .urlutils import first_srcset_url, lazy_image_src
+
+_ITEM_ID_RE = re.compile(r"(br-[0-9a-z]+)$", re.IGNORECASE)
+
+_CONSENT_SELECTORS = (
+    'button:has-text("Alle akzeptieren")',
+    'button:has-text("Akzeptieren")',
+    "#onetrust-accept-btn-handler",
+    '[data-testid="uc-accept-all-button"]',
+    "button.cc-btn.cc-allow",
+)
 
 
 class FitshopScraper(BaseScraper):
@@ -21,8 +35,47 @@ class FitshopScraper(BaseScraper):
     display_name = "Fitshop"
     url = "https://www.fitshop.de/blackroll-faszientraining-faszienrollen"
 
+    # Only image URLs are read from the page; the files themselves are fetched over httpx.
+    block_resources = DEFAULT_BLOCKED_RESOURCES | {"image"}
+
     async def scrape(self) -> ScrapeResult:
-        async with get_browser_context() as context:
+        products = await self._scrape_http()
+        if products is None:
+            print(f"[{self.name}] No product list in HTML, falling back to browser")
+            products = await self._scrape_browser()
+        print(f"[{self.name}] Extracted {len(products)} products")
+
+        return ScrapeResult(
+            source=self.name,
+            source_url=self.url,
+            scraped_at=datetime.now(UTC),
+            products=products,
+        )
+
+    async def _scrape_http(self) -> list[Product] | None:
+        """Scrape the server-rendered listing; returns None when the HTML has no product entries."""
+        client = shared_client()
+        print(f"[{self.name}] Loading {self.url}...")
+        try:
+            resp = await client.get(self.url, headers={"Accept-Language": "de-DE,de;q=0.9"})
+            resp.raise_for_status()
+        except Exception as e:
+            print(f"[{self.name}] HTTP fetch failed: {e}")
+            return None
+
+        rows = self._rows_from_html(resp.text)
+        print(f"[{self.name}] Found {len(rows)} product entries")
+        parsed = self.parse_rows(rows, self._parse_row)
+        if not parsed:
+            return None
+        return await self.build_products(client, parsed)
+
+    async def _scrape_browser(self) -> list[Product]:
+        async with get_browser_context(
+            block_resources=self.block_resources,
+            # A state file (not a browser profile) so overlapping jobs can't contend for a profile lock
+            storage_state=DEFAULT_CACHE_DIR / "state" / f"{self.name}.json" if cache_enabled() else None,
+        ) as context:
             page = await context.new_page()
 
             print(f"[{self.name}] Loading {self.url}...")
@@ -34,32 +87,11 @@ class FitshopScraper(BaseScraper):
             await self._handle_cookie_consent(page)
             await page.wait_for_timeout(1200)
 
-            products = await self.extract_products(page)
-            print(f"[{self.name}] Extracted {len(products)} products")
-
-        return ScrapeResult(
-            source=self.name,
-            source_url=self.url,
-            scraped_at=datetime.now(UTC),
-            products=products,
-        )
+            return await self.extract_products(page)
 
     async def _handle_cookie_consent(self, page: Page) -> None:
-        for selector in [
-            'button:has-text("Alle akzeptieren")',
-            'button:has-text("Akzeptieren")',
-            "#onetrust-accept-btn-handler",
-            '[data-testid="uc-accept-all-button"]',
-            "button.cc-btn.cc-allow",
-        ]:
-            try:
-                btn = await page.query_selector(selector)
-                if btn and await btn.is_visible():
-                    await btn.click()
-                    await page.wait_for_timeout(800)
-                    return
-            except Exception:
-                continue
+        if await click_first_visible(page, _CONSENT_SELECTORS, remember_as=self.name):
+            await page.wait_for_timeout(800)
 
     @staticmethod
     def _extract_item_id(url: str | None) -> str | None:
@@ -72,86 +104,77 @@ class FitshopScraper(BaseScraper):
         if not path:
             return None
         slug = path.split("/")[-1]
-        if match := re.search(r"(br-[0-9a-z]+)$", slug, flags=re.IGNORECASE):
+        if match := _ITEM_ID_RE.search(slug):
             return match.group(1).lower()
         return slug
 
     async def extract_products(self, page: Page) -> list[Product]:
-        products: list[Product] = []
-
         await page.wait_for_selector("li.product-list-entry", timeout=60000, state="attached")
         await page.wait_for_timeout(800)
 
-        items = await page.query_selector_all("li.product-list-entry")
-        print(f"[{self.name}] Found {len(items)} product entries")
+        await scroll_through(page)
+
+        # One round-trip for all tiles instead of several per tile.
+        rows = await page.locator("li.product-list-entry").evaluate_all(
+            """
+            els => els.map(el => {
+              const link = el.querySelector('.title-wrapper a[href]') || el.querySelector('a.product-click[href]');
+              const priceEl = el.querySelector('.price-now');
+              const img = el.querySelector('.image-wrapper img');
+              return {
+                href: link ? link.getAttribute('href') : null,
+                name: link ? link.innerText : null,
+                priceText: priceEl ? priceEl.innerText : null,
+                imgSrc: img
+                  ? img.getAttribute('src') || img.getAttribute('data-src')
+                    || img.getAttribute('data-srcset') || img.getAttribute('srcset')
+                  : null,
+              };
+            })
+            """,
+        )
 
-        for idx, item in enumerate(items):
-            try:
-                link_el = await item.query_selector(".title-wrapper a[href]") or await item.query_selector(
-                    "a.product-click[href]"
-                )
-                href = await link_el.get_attribute("href") if link_el else None
-                url = urljoin("https://www.fitshop.de", href) if href else None
-
-                name = None
-                if link_el:
-                    name = (await link_el.inner_text()).strip() or None
-
-                price_text = None
-                if price_el := await item.query_selector(".price-now"):
-                    price_text = (await price_el.inner_text()).strip()
-                price, currency = parse_price(price_text)
-
-                image_bytes = None
-                image_mime = None
-                image_url = None
-
-                try:
-                    await item.scroll_into_view_if_needed()
-                    await page.wait_for_timeout(100)
-                except Exception:
-                    pass
-
-                img_el = await item.query_selector(".image-wrapper img")
-                if img_el:
-                    image_url = (
-                        await img_el.get_attribute("src")
-                        or await img_el.get_attribute("data-src")
-                        or await img_el.get_attribute("data-srcset")
-                        or await img_el.get_attribute("srcset")
-                    )
-                    if image_url and "," in image_url:
-                        image_url = image_url.split(",")[0].split()[0]
-
-                if image_url:
-                    image_url = urljoin("https://www.fitshop.de", image_url)
-                    try:
-                        resp = await page.context.request.get(image_url, timeout=30000)
-                        if resp.ok:
-                            body = await resp.body()
-                            if len(body) >= 800:
-                                image_bytes = body
-                                image_mime = resp.headers.get("content-type")
-                                if image_mime and ";" in image_mime:
-                                    image_mime = image_mime.split(";", 1)[0].strip()
-                    except Exception as img_err:
-                        print(f"[{self.name}] Failed to fetch image for item {idx}: {img_err}")
-
-                if name:
-                    products.append(
-                        Product(
-                            name=name,
-                            price=price,
-                            currency=currency,
-                            url=url,
-                            item_id=self._extract_item_id(url),
-                            image=image_bytes,
-                            image_mime=image_mime,
-                        )
-                    )
+        print(f"[{self.name}] Found {len(rows)} product entries")
 
-            except Exception as e:
-                print(f"[{self.name}] Error extracting product {idx}: {e}")
+        async with await image_client_from_context(page.context, user_agent=self.user_agent) as client:
+            return await self.build_products(client, self.parse_rows(rows, self._parse_row))
 
-        return products
+    @staticmethod
+    def _rows_from_html(html: str) -> list[dict]:
+        """Same fields as the in-page extraction in `extract_products`, from static HTML."""
+        soup = BeautifulSoup(html, "lxml")
+        rows: list[dict] = []
+        for item in soup.select("li.product-list-entry"):
+            link = item.select_one(".title-wrapper a[href]") or item.select_one("a.product-click[href]")
+            price_el = item.select_one(".price-now")
+            img = item.select_one(".image-wrapper img")
+            rows.append(
+                {
+                    "href": link.get("href") if link else None,
+                    "name": " ".join(link.get_text(" ").split()) if link else None,
+                    "priceText": price_el.get_text(" ", strip=True) if price_el else None,
+                    "imgSrc": lazy_image_src(img),
+                }
+            )
+        return rows
+
+    def _parse_row(self, row: dict) -> dict | None:
+        name = (row.get("name") or "").strip() or None
+        if not name:
+            return None
 
+        href = row.get("href")
+        url = urljoin("https://www.fitshop.de", href) if href else None
+
+        price_text = (row.get("priceText") or "").strip() or None
+        price, currency = parse_price(price_text)
+
+        image_url = first_srcset_url(row.get("imgSrc"))
+        return {
+            "name": name,
+            "price": price,
+            "currency": currency,
+            "url": url,
+            "item_id": self._extract_item_id(url),
+            "image_url": urljoin("https://www.fitshop.de", image_url) if image_url else None,
+        }
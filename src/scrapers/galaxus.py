@@ -1,28 +1,61 @@
 """Scrapers for Galaxus.ch and Galaxus.de Blackroll products."""
 
+import re
 from datetime import datetime, UTC
 
-from playwright.async_api import Page, async_playwright
+from playwright.async_api import Page
 
 from ..models import Product, ScrapeResult
 from ..utils import parse_price
-from .base import BaseScraper
+from .base import BaseScraper, click_first_visible, scroll_through
+from .browser_pool import DEFAULT_BLOCKED_RESOURCES, get_browser_context
+from .http_cache import DEFAULT_CACHE_DIR, cache_enabled
+from .http_client import image_client_from_context
+from .urlutils import first_srcset_url, normalize
+
+# Item id is the last long number sequence in the product URL
+_ITEM_ID_RE = re.compile(r"-(\d{6,})(?:\?|$|/|#)")
+
+# True once every product card's image carries a URL (image requests themselves are blocked)
+_CARD_IMAGES_READY_JS = """
+() => Array.from(document.querySelectorAll('article img')).every(
+  img => img.getAttribute('src') || img.getAttribute('data-src') || img.getAttribute('srcset')
+)
+"""
+
+_CONSENT_SELECTORS = (
+    'button:has-text("Allem zustimmen")',
+    'button:has-text("Alle akzeptieren")',
+    '[data-testid="accept-all-button"]',
+    'button[class*="accept"]',
+)
 
 
 class GalaxusBaseScraper(BaseScraper):
     """Base scraper for Galaxus sites (shared logic for CH and DE)."""
 
     base_url: str  # e.g., "https://www.galaxus.ch"
+    # Firefox - better compatibility with strict sites
+    browser_type = "firefox"
+    locale = "de-CH"
+    viewport = {"width": 1920, "height": 1080}
+    # Extraction only reads image URLs from the DOM and downloads go through a separate
+    # httpx client, so the page itself never needs to load images.
+    block_resources = DEFAULT_BLOCKED_RESOURCES | {"image"}
+    # Subclasses can turn this off for a lightweight run without image downloads
+    fetch_images: bool = True
 
     async def scrape(self) -> ScrapeResult:
         """Run the scraper with Galaxus-specific handling."""
-        async with async_playwright() as p:
-            # Use Firefox - better compatibility with strict sites
-            browser = await p.firefox.launch(headless=True)
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                locale="de-CH",
-            )
+        async with get_browser_context(
+            browser_type=self.browser_type,
+            viewport=self.viewport,
+            locale=self.locale,
+            block_resources=self.block_resources,
+            # Saved cookies/localStorage keep the consent decision between runs while the
+            # context stays on the shared Firefox (a profile would need its own process)
+            storage_state=DEFAULT_CACHE_DIR / "state" / f"{self.name}.json" if cache_enabled() else None,
+        ) as context:
             page = await context.new_page()
 
             print(f"[{self.name}] Loading {self.url}...")
@@ -34,14 +67,9 @@ class GalaxusBaseScraper(BaseScraper):
             # Handle cookie consent banner
             await self._handle_cookie_consent(page)
 
-            # Wait for products to load
-            await page.wait_for_timeout(3000)
-
             products = await self.extract_products(page)
             print(f"[{self.name}] Extracted {len(products)} products")
 
-            await browser.close()
-
         return ScrapeResult(
             source=self.name,
             source_url=self.url,
@@ -51,133 +79,110 @@ class GalaxusBaseScraper(BaseScraper):
 
     async def _handle_cookie_consent(self, page: Page) -> None:
         """Handle Galaxus cookie consent banner if present."""
-        for selector in [
-            'button:has-text("Allem zustimmen")',
-            'button:has-text("Alle akzeptieren")',
-            '[data-testid="accept-all-button"]',
-            'button[class*="accept"]',
-        ]:
-            try:
-                btn = await page.query_selector(selector)
-                if btn and await btn.is_visible():
-                    print(f"[{self.name}] Accepting cookies...")
-                    await btn.click()
-                    await page.wait_for_timeout(1000)
-                    return
-            except Exception:
-                continue
+        if await click_first_visible(page, _CONSENT_SELECTORS, remember_as=self.name):
+            print(f"[{self.name}] Accepted cookies")
+            await page.wait_for_timeout(1000)
 
     async def extract_products(self, page: Page) -> list[Product]:
         """Extract all Blackroll products from the page."""
-        import re
-        products: list[Product] = []
-
-        # Wait for product articles to load
-        await page.wait_for_timeout(3000)
-
-        # Find article elements (product cards)
-        product_elements = await page.query_selector_all("article")
-        print(f"[{self.name}] Found {len(product_elements)} article elements")
-
-        for idx, article in enumerate(product_elements):
-            try:
-                # Get product link with aria-label (contains product name)
-                link = await article.query_selector('a[href*="/product/"]')
-                if not link:
-                    continue
-
-                # Get name from aria-label
-                name = await link.get_attribute("aria-label")
-                if not name:
-                    continue
-
-                # Clean up HTML entities
-                name = name.replace("\xa0", " ").strip()
-
-                # Get URL
-                url = await link.get_attribute("href")
-                if url and not url.startswith("http"):
-                    url = f"{self.base_url}{url}"
-
-                # Extract item_id from URL (last number sequence)
-                item_id = None
-                if url:
-                    if match := re.search(r"-(\d{6,})(?:\?|$|/|#)", url):
-                        item_id = match.group(1)
-
-                # Get price from price container
-                price = None
-                currency = None
-                price_container = await article.query_selector('div[class*="yRGTUHk"]')
-                if price_container:
-                    price_text = await price_container.inner_text()
-                    price, currency = parse_price(price_text)
-
-                # Try to fetch the product image
-                image_bytes = None
-                image_mime = None
-                image_url = None
-
-                try:
-                    await article.scroll_into_view_if_needed()
-                    await page.wait_for_timeout(100)
-                except Exception:
-                    pass
-
-                img_el = None
-                for _ in range(4):
-                    if not img_el:
-                        img_el = await article.query_selector("picture img") or await article.query_selector("img")
-                    if img_el:
-                        image_url = (
-                            await img_el.get_attribute("src")
-                            or await img_el.get_attribute("data-src")
-                            or await img_el.get_attribute("data-srcset")
-                            or await img_el.get_attribute("srcset")
-                        )
-                        if image_url:
-                            if "," in image_url:
-                                image_url = image_url.split(",")[0].split()[0]
-                            break
-                    await page.wait_for_timeout(150)
-
-                if not image_url:
-                    source_el = await article.query_selector("picture source[srcset]")
-                    if source_el:
-                        image_url = await source_el.get_attribute("srcset")
-                        if image_url and "," in image_url:
-                            image_url = image_url.split(",")[0].split()[0]
-
-                if image_url:
-                    if image_url.startswith("//"):
-                        image_url = f"https:{image_url}"
-                    elif image_url.startswith("/"):
-                        image_url = f"{self.base_url}{image_url}"
-
-                    try:
-                        response = await page.context.request.get(image_url)
-                        if response.ok:
-                            image_bytes = await response.body()
-                            image_mime = response.headers.get("content-type")
-                            if image_mime and ";" in image_mime:
-                                image_mime = image_mime.split(";", 1)[0].strip()
-                    except Exception as img_err:
-                        print(f"[{self.name}] Failed to fetch image for {name}: {img_err}")
-
-                products.append(Product(
-                    name=name,
-                    price=price,
-                    currency=currency,
-                    url=url,
-                    item_id=item_id,
-                    image=image_bytes,
-                    image_mime=image_mime,
-                ))
-
-            except Exception as e:
-                print(f"[{self.name}] Error extracting product {idx}: {e}")
-
-        return products
+        # Wait for the first product card instead of sleeping a fixed interval
+        try:
+            await page.wait_for_selector('article a[href*="/product/"]', timeout=15000, state="attached")
+        except Exception:
+            # Empty or blocked listing; extraction below finds nothing
+            pass
+
+        # Scroll through the page once so lazy-loaded images get their src, then wait
+        # (bounded) until every card image has one rather than polling card by card
+        await scroll_through(page, settle_ms=0)
+        try:
+            await page.wait_for_function(_CARD_IMAGES_READY_JS, timeout=3000)
+        except Exception:
+            # Cards still without an image URL fall back to their <source> srcset
+            pass
+
+        # Read all cards in one round-trip instead of several per card
+        rows = await page.locator("article").evaluate_all(
+            """
+            els => els.map(el => {
+              const link = el.querySelector('a[href*="/product/"]');
+              if (!link) return null;
+              const priceEl = el.querySelector('div[class*="yRGTUHk"]');
+              const img = el.querySelector('picture img') || el.querySelector('img');
+              const source = el.querySelector('picture source[srcset]');
+              return {
+                name: link.getAttribute('aria-label'),
+                href: link.getAttribute('href'),
+                priceText: priceEl ? priceEl.innerText : null,
+                imgSrc: img
+                  ? img.getAttribute('src') || img.getAttribute('data-src')
+                    || img.getAttribute('data-srcset') || img.getAttribute('srcset')
+                  : null,
+                sourceSrcset: source ? source.getAttribute('srcset') : null,
+              };
+            })
+            """,
+        )
+        print(f"[{self.name}] Found {len(rows)} article elements")
+
+        parsed = self.parse_rows(rows, self._parse_row)
+        if not self.fetch_images:
+            return [
+                Product(
+                    name=entry["name"],
+                    price=entry["price"],
+                    currency=entry["currency"],
+                    url=entry["url"],
+                    item_id=entry["item_id"],
+                )
+                for entry in parsed
+            ]
+
+        # Fetch all images concurrently once every article has been read
+        async with await image_client_from_context(page.context, user_agent=self.user_agent) as client:
+            return await self.build_products(client, parsed)
+
+    def _parse_row(self, row: dict | None) -> dict | None:
+        # Cards without a product link are ads/teasers
+        if not row:
+            return None
+
+        # Get name from aria-label
+        name = row.get("name")
+        if not name:
+            return None
+
+        # Clean up HTML entities
+        name = name.replace("\xa0", " ").strip()
+
+        # Get URL
+        url = row.get("href")
+        if url and not url.startswith("http"):
+            url = f"{self.base_url}{url}"
+
+        # Extract item_id from URL (last number sequence)
+        item_id = None
+        if url:
+            if match := _ITEM_ID_RE.search(url):
+                item_id = match.group(1)
+
+        # Get price from price container
+        price = None
+        currency = None
+        if price_text := row.get("priceText"):
+            price, currency = parse_price(price_text)
+
+        # Pick the product image (downloaded after all articles are read)
+        image_url = first_srcset_url(row.get("imgSrc") or row.get("sourceSrcset"))
+
+        return {
+            "name": name,
+            "price": price,
+            "currency": currency,
+            "url": url,
+            "item_id": item_id,
+            "image_url": normalize(image_url, base=self.base_url),
+        }
 
 
 class GalaxusCHScraper(GalaxusBaseScraper):
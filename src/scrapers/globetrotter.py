@@ -3,13 +3,28 @@
 from __future__ import annotations
 
 import re
+from datetime import datetime, UTC
 from urllib.parse import parse_qs, urljoin, urlparse
 
+from bs4 import BeautifulSoup
 from playwright.async_api import Page
 
-from ..models import Product
+from ..models import Product, ScrapeResult
 from ..utils import parse_price
-from .base import BaseScraper
+from .base import BaseScraper, click_first_visible, scroll_through
+from .browser_pool import DEFAULT_BLOCKED_RESOURCES
+from .http_client import image_client_from_context, shared_client
+from .urlutils import first_srcset_url, lazy_image_src
+
+_ITEM_ID_RE = re.compile(r"-(\d{5,})/?$")
+
+_CONSENT_SELECTORS = (
+    'button:has-text("Alle akzeptieren")',
+    'button:has-text("Akzeptieren")',
+    "#onetrust-accept-btn-handler",
+    '[data-testid="uc-accept-all-button"]',
+    "button#uc-btn-accept-banner",
+)
 
 
 class GlobetrotterScraper(BaseScraper):
@@ -19,36 +34,47 @@ class GlobetrotterScraper(BaseScraper):
     display_name = "Globetrotter"
     url = "https://www.globetrotter.de/marken/blackroll/"
 
-    async def _handle_cookie_consent(self, page: Page) -> None:
-        selectors = [
-            'button:has-text("Alle akzeptieren")',
-            'button:has-text("Akzeptieren")',
-            "#onetrust-accept-btn-handler",
-            '[data-testid="uc-accept-all-button"]',
-            "button#uc-btn-accept-banner",
-        ]
-
-        # Consent manager is often embedded in an iframe; try main page first, then frames.
-        for selector in selectors:
-            try:
-                el = await page.query_selector(selector)
-                if el and await el.is_visible():
-                    await el.click()
-                    await page.wait_for_timeout(800)
-                    return
-            except Exception:
-                continue
+    # Tile images are downloaded separately, so the browser can skip them.
+    block_resources = DEFAULT_BLOCKED_RESOURCES | {"image"}
+
+    async def scrape(self) -> ScrapeResult:
+        products = await self._scrape_http()
+        if products is None:
+            print(f"[{self.name}] No product tiles in HTML, falling back to browser")
+            return await super().scrape()
+        print(f"[{self.name}] Extracted {len(products)} products")
+
+        return ScrapeResult(
+            source=self.name,
+            source_url=self.url,
+            scraped_at=datetime.now(UTC),
+            products=products,
+        )
+
+    async def _scrape_http(self) -> list[Product] | None:
+        """Scrape the server-rendered listing; returns None when the HTML has no product tiles."""
+        client = shared_client()
+        print(f"[{self.name}] Loading {self.url}...")
+        try:
+            resp = await client.get(self.url, headers={"Accept-Language": "de-DE,de;q=0.9"})
+            resp.raise_for_status()
+        except Exception as e:
+            print(f"[{self.name}] HTTP fetch failed: {e}")
+            return None
+
+        rows = self._rows_from_html(resp.text)
+        print(f"[{self.name}] Found {len(rows)} product tiles")
+        parsed = self.parse_rows(rows, self._parse_row)
+        if not parsed:
+            return None
+        return await self.build_products(client, parsed)
 
+    async def _handle_cookie_consent(self, page: Page) -> None:
+        # Consent manager is often embedded in an iframe; `frames` starts with the main frame.
         for frame in page.frames:
-            for selector in selectors:
-                try:
-                    el = await frame.query_selector(selector)
-                    if el and await el.is_visible():
-                        await el.click()
-                        await page.wait_for_timeout(800)
-                        return
-                except Exception:
-                    continue
+            if await click_first_visible(frame, _CONSENT_SELECTORS, remember_as=self.name):
+                await page.wait_for_timeout(800)
+                return
 
     @staticmethod
     def _extract_item_id(url: str | None) -> str | None:
@@ -69,100 +95,96 @@ class GlobetrotterScraper(BaseScraper):
         else:
             path = url.strip("/")
 
-        if match := re.search(r"-(\d{5,})/?$", path):
+        if match := _ITEM_ID_RE.search(path):
             return match.group(1)
 
         slug = path.split("/")[-1]
         return slug or None
 
     async def extract_products(self, page: Page) -> list[Product]:
-        products: list[Product] = []
-
         await self._handle_cookie_consent(page)
 
         await page.wait_for_selector("a.pdpLink[href]", timeout=60000, state="attached")
         await page.wait_for_timeout(800)
 
-        tiles = await page.query_selector_all("a.pdpLink[href]")
-        print(f"[{self.name}] Found {len(tiles)} product tiles")
-
-        for idx, tile in enumerate(tiles):
-            try:
-                href = await tile.get_attribute("href")
-                if not href:
-                    continue
-
-                url = urljoin("https://www.globetrotter.de", href)
-
-                brand_el = await tile.query_selector(".brand")
-                brand = (await brand_el.inner_text()).strip() if brand_el else None
-
-                name_el = await tile.query_selector(".name")
-                name = (await name_el.inner_text()).strip() if name_el else None
-
-                if not name:
-                    sr_el = await tile.query_selector(".sr-only")
-                    name = (await sr_el.inner_text()).strip() if sr_el else None
-
-                if brand and name and brand.lower() not in name.lower():
-                    name = f"{brand} {name}"
-
-                price_el = await tile.query_selector(".price")
-                price_text = (await price_el.inner_text()).strip() if price_el else None
-                price, currency = parse_price(price_text)
-
-                image_bytes = None
-                image_mime = None
-                image_url = None
-
-                try:
-                    await tile.scroll_into_view_if_needed()
-                    await page.wait_for_timeout(80)
-                except Exception:
-                    pass
-
-                img_el = await tile.query_selector("img.js-main-list-image") or await tile.query_selector(
-                    "img[src]"
-                )
-                if img_el:
-                    image_url = (
-                        await img_el.get_attribute("src")
-                        or await img_el.get_attribute("data-src")
-                        or await img_el.get_attribute("data-srcset")
-                        or await img_el.get_attribute("srcset")
-                    )
-                    if image_url and "," in image_url:
-                        image_url = image_url.split(",")[0].split()[0]
-
-                if image_url:
-                    image_url = urljoin("https://www.globetrotter.de", image_url)
-                    try:
-                        resp = await page.context.request.get(image_url, timeout=30000)
-                        if resp.ok:
-                            body = await resp.body()
-                            if len(body) >= 800:
-                                image_bytes = body
-                                image_mime = resp.headers.get("content-type")
-                                if image_mime and ";" in image_mime:
-                                    image_mime = image_mime.split(";", 1)[0].strip()
-                    except Exception as img_err:
-                        print(f"[{self.name}] Failed to fetch image for tile {idx}: {img_err}")
-
-                if name:
-                    products.append(
-                        Product(
-                            name=name,
-                            price=price,
-                            currency=currency,
-                            url=url,
-                            item_id=self._extract_item_id(url),
-                            image=image_bytes,
-                            image_mime=image_mime,
-                        )
-                    )
-
-            except Exception as e:
-                print(f"[{self.name}] Error extracting product {idx}: {e}")
-
-        return products
+        await scroll_through(page)
+
+        # One round-trip for all tiles instead of several per tile.
+        rows = await page.locator("a.pdpLink[href]").evaluate_all(
+            """
+            els => els.map(el => {
+              const text = sel => {
+                const found = el.querySelector(sel);
+                return found ? found.innerText : null;
+              };
+              const img = el.querySelector('img.js-main-list-image') || el.querySelector('img[src]');
+              return {
+                href: el.getAttribute('href'),
+                brand: text('.brand'),
+                name: text('.name'),
+                srName: text('.sr-only'),
+                priceText: text('.price'),
+                imgSrc: img
+                  ? img.getAttribute('src') || img.getAttribute('data-src')
+                    || img.getAttribute('data-srcset') || img.getAttribute('srcset')
+                  : null,
+              };
+            })
+            """,
+        )
+
+        print(f"[{self.name}] Found {len(rows)} product tiles")
+
+        async with await image_client_from_context(page.context, user_agent=self.user_agent) as client:
+            return await self.build_products(client, self.parse_rows(rows, self._parse_row))
 
+    @staticmethod
+    def _rows_from_html(html: str) -> list[dict]:
+        """Same fields as the in-page extraction in `extract_products`, from static HTML."""
+        soup = BeautifulSoup(html, "lxml")
+
+        def text(tile, selector: str) -> str | None:
+            found = tile.select_one(selector)
+            return " ".join(found.get_text(" ").split()) if found else None
+
+        rows: list[dict] = []
+        for tile in soup.select("a.pdpLink[href]"):
+            img = tile.select_one("img.js-main-list-image") or tile.select_one("img[src]")
+            rows.append(
+                {
+                    "href": tile.get("href"),
+                    "brand": text(tile, ".brand"),
+                    "name": text(tile, ".name"),
+                    "srName": text(tile, ".sr-only"),
+                    "priceText": text(tile, ".price"),
+                    "imgSrc": lazy_image_src(img),
+                }
+            )
+        return rows
+
+    def _parse_row(self, row: dict) -> dict | None:
+        href = row.get("href")
+        if not href:
+            return None
+
+        url = urljoin("https://www.globetrotter.de", href)
+
+        brand = (row.get("brand") or "").strip() or None
+        name = (row.get("name") or "").strip() or (row.get("srName") or "").strip() or None
+        if not name:
+            return None
+        if brand and brand.lower() not in name.lower():
+            name = f"{brand} {name}"
+
+        price_text = (row.get("priceText") or "").strip() or None
+        price, currency = parse_price(price_text)
+
+        image_url = first_srcset_url(row.get("imgSrc"))
+        return {
+            "name": name,
+            "price": price,
+            "currency": currency,
+            "url": url,
+            "item_id": self._extract_item_id(url),
+            "image_url": urljoin("https://www.globetrotter.de", image_url) if image_url else None,
+        }
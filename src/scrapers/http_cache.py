@@ -0,0 +1,51 @@
+"""Small on-disk cache for slow-changing remote responses.
+
+Entries are keyed by the SHA-256 of the URL and expire based on file mtime.
+Set `CORASTUFF_NO_CACHE=1` (or pass `--no-cache` to the CLI) to bypass it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / "output" / "cache"
+
+
+def cache_enabled() -> bool:
+    """Return whether the on-disk cache should be used in this process."""
+    return not os.environ.get("CORASTUFF_NO_CACHE")
+
+
+def _cache_path(url: str, cache_dir: Path | None) -> Path:
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return (cache_dir or DEFAULT_CACHE_DIR) / digest
+
+
+def cache_get(url: str, *, ttl: float, cache_dir: Path | None = None) -> bytes | None:
+    """Return the cached body for `url` if present and younger than `ttl` seconds."""
+    if not cache_enabled():
+        return None
+    path = _cache_path(url, cache_dir)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def cache_put(url: str, body: bytes, *, cache_dir: Path | None = None) -> None:
+    """Store `body` for `url`. Best-effort: write failures are ignored."""
+    if not cache_enabled():
+        return
+    path = _cache_path(url, cache_dir)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(body)
+        tmp.replace(path)
+    except OSError:
+        pass
@@ -0,0 +1,82 @@
+"""Process-wide HTTP/2 client for plain (non-browser) requests.
+
+Scrapers that fetch listings or images without cookies share one connection pool,
+so repeat requests to a host (and concurrent scrapes hitting the same CDN) reuse
+open TLS connections instead of handshaking per client. The client never stores
+cookies, so nothing leaks from one scraper's requests into another's.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+)
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+def shared_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it for the running event loop if needed.
+
+    Callers must not close it; per-request headers override the defaults.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    # Pooled connections belong to the loop that opened them.
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            headers={"User-Agent": DEFAULT_USER_AGENT},
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            http2=True,
+            follow_redirects=True,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64, keepalive_expiry=120),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_shared_client() -> None:
+    """Close the shared client (if any); the next `shared_client()` call opens a new one."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+async def image_client_from_context(
+    context: BrowserContext,
+    *,
+    user_agent: str | None = None,
+    timeout: float = 30.0,
+    max_keepalive_connections: int = 16,
+) -> httpx.AsyncClient:
+    """Per-run HTTP/2 client for image downloads that carries over `context`'s cookies.
+
+    Without `user_agent`, the browser's own user agent is read from the context's first page
+    so CDNs that bind cookies to the user agent keep accepting them. The caller closes it.
+    """
+    cookies = httpx.Cookies()
+    for cookie in await context.cookies():
+        cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain", ""), path=cookie.get("path", "/"))
+    if user_agent is None and context.pages:
+        user_agent = await context.pages[0].evaluate("() => navigator.userAgent")
+    return httpx.AsyncClient(
+        headers={"User-Agent": user_agent or DEFAULT_USER_AGENT},
+        cookies=cookies,
+        http2=True,
+        follow_redirects=True,
+        timeout=httpx.Timeout(timeout),
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=max_keepalive_connections),
+    )
@@ -0,0 +1,187 @@
+"""Process-wide de-duplication of product image downloads.
+
+Listings frequently reuse the same hero image for several products/variants.
+`cached_fetch` makes concurrent requests for one URL share a single download
+and memoizes successful results in a bounded LRU whose entries expire after
+`MAX_AGE` seconds, so a long-running worker picks up changed images.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Mapping
+
+import httpx
+
+ImageResult = tuple[bytes | None, str | None]
+ImageFetcher = Callable[[str], Awaitable[ImageResult]]
+
+MAX_ENTRIES = 1024
+MAX_BYTES = 64 * 1024 * 1024
+# Seconds a memoized image is reused: long enough to span one run of all scrapers.
+MAX_AGE = 15 * 60
+
+# Bounds for a single product image body; smaller ones are placeholders/tracking pixels.
+MIN_IMAGE_BYTES = 800
+MAX_IMAGE_BYTES = 3 * 1024 * 1024
+
+_inflight: dict[str, asyncio.Future[ImageResult]] = {}
+# url -> (stored at, per time.monotonic(), result)
+_done: OrderedDict[str, tuple[float, ImageResult]] = OrderedDict()
+_done_bytes = 0
+
+
+def _remember(url: str, result: ImageResult) -> None:
+    global _done_bytes
+    body = result[0]
+    if not body or len(body) > MAX_BYTES:
+        return
+    _forget(url)
+    _done[url] = (time.monotonic(), result)
+    _done_bytes += len(body)
+    while _done and (len(_done) > MAX_ENTRIES or _done_bytes > MAX_BYTES):
+        _, (_, (evicted, _)) = _done.popitem(last=False)
+        _done_bytes -= len(evicted or b"")
+
+
+def _forget(url: str) -> None:
+    global _done_bytes
+    if (entry := _done.pop(url, None)) is not None:
+        _done_bytes -= len(entry[1][0] or b"")
+
+
+def _on_done(url: str, task: asyncio.Future[ImageResult]) -> None:
+    _inflight.pop(url, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    _remember(url, task.result())
+
+
+async def cached_fetch(url: str | None, fetcher: ImageFetcher) -> ImageResult:
+    """Fetch `url` via `fetcher`, sharing in-flight downloads and reusing recent results.
+
+    Only successful downloads (non-empty body) are memoized, so failures are retried;
+    memoized results older than `MAX_AGE` are downloaded again.
+    """
+    if not url:
+        return None, None
+
+    if (entry := _done.get(url)) is not None:
+        stored_at, hit = entry
+        if time.monotonic() - stored_at <= MAX_AGE:
+            _done.move_to_end(url)
+            return hit
+        _forget(url)
+
+    task = _inflight.get(url)
+    if task is None:
+        task = asyncio.ensure_future(fetcher(url))
+        _inflight[url] = task
+        task.add_done_callback(lambda t: _on_done(url, t))
+    # Shield so one cancelled caller does not abort the download for the others.
+    return await asyncio.shield(task)
+
+
+def clear() -> None:
+    """Drop all memoized images."""
+    global _done_bytes
+    _done.clear()
+    _done_bytes = 0
+
+
+async def read_image_body(
+    resp: httpx.Response,
+    *,
+    min_bytes: int = MIN_IMAGE_BYTES,
+    max_bytes: int = MAX_IMAGE_BYTES,
+) -> bytes | None:
+    """Read a streamed image response, or return None if its size is out of bounds.
+
+    A declared Content-Length is checked before anything is read; otherwise the body is
+    streamed and abandoned as soon as it exceeds `max_bytes`.
+    """
+    content_length = resp.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        size = int(content_length)
+        if size < min_bytes or size > max_bytes:
+            return None
+
+    body = bytearray()
+    async for chunk in resp.aiter_bytes():
+        body.extend(chunk)
+        if len(body) > max_bytes:
+            return None
+    if len(body) < min_bytes:
+        return None
+    return bytes(body)
+
+
+def sniff_image_mime(body: bytes | None) -> str | None:
+    """Identify PNG/JPEG/WebP/GIF from the body's magic bytes; None if unrecognised."""
+    if not body:
+        return None
+    if body.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if body.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if body[:4] == b"RIFF" and body[8:12] == b"WEBP":
+        return "image/webp"
+    if body[:6] in (b"GIF87a", b"GIF89a"):
+        return "image/gif"
+    return None
+
+
+async def fetch_image(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    headers: Mapping[str, str] | None = None,
+    skip_mimes: frozenset[str] = frozenset(),
+) -> ImageResult:
+    """Stream one image through `read_image_body`; (None, None) on any failure.
+
+    Responses declared as text or as a type in `skip_mimes` are dropped before the body is read.
+    The returned MIME type prefers the body's magic bytes, since some CDNs omit or
+    mislabel Content-Type.
+    """
+    try:
+        async with client.stream("GET", url, headers=headers) as resp:
+            if not resp.is_success:
+                return None, None
+            content_type = (resp.headers.get("content-type") or "").split(";", 1)[0].strip()
+            # Error/consent pages come back as HTML with a 200; don't read them.
+            if content_type in skip_mimes or content_type.startswith("text/"):
+                return None, None
+            body = await read_image_body(resp)
+    except Exception:
+        # Callers report missing images once per run rather than per URL.
+        return None, None
+    if body is None:
+        return None, None
+    return body, sniff_image_mime(body) or content_type or None
+
+
+async def fetch_images(
+    client: httpx.AsyncClient | None,
+    urls: list[str | None],
+    *,
+    headers: Mapping[str, str] | None = None,
+    concurrency: int = 8,
+    fetcher: ImageFetcher | None = None,
+) -> list[ImageResult]:
+    """Download `urls` concurrently (at most `concurrency` at a time), in input order.
+
+    Goes through `cached_fetch`, so repeated URLs share one download; None entries yield (None, None).
+    `fetcher`, if given, replaces `fetch_image` through `client` (which may then be None).
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def download(url: str) -> ImageResult:
+        async with semaphore:
+            if fetcher is not None:
+                return await fetcher(url)
+            return await fetch_image(client, url, headers=headers)
+
+    return list(await asyncio.gather(*(cached_fetch(url, download) for url in urls)))
@@ -3,14 +3,61 @@
 from __future__ import annotations
 
 from datetime import datetime, UTC
-import re
 from urllib.parse import parse_qs, urljoin, urlparse
 
-from playwright.async_api import Page, async_playwright
+from playwright.async_api import Page
 
 from ..models import Product, ScrapeResult
 from ..utils import parse_price
-from .base import BaseScraper
+from .base import BaseScraper, click_first_visible
+from .browser_pool import DEFAULT_BLOCKED_RESOURCES, get_browser_context
+from .http_cache import DEFAULT_CACHE_DIR, cache_enabled
+from .http_client import shared_client
+
+_CONSENT_SELECTORS = (
+    'button:has-text("Alle akzeptieren")',
+    'button:has-text("Akzeptieren")',
+    "#onetrust-accept-btn-handler",
+    '[data-testid="uc-accept-all-button"]',
+)
+
+# Ready once three tiles (or every tile, on smaller listings) have an image.
+_TILE_IMAGES_READY_JS = """
+() => {
+  const tiles = document.querySelectorAll('[data-testid="product-tile"]').length;
+  const images = document.querySelectorAll(
+    '[data-testid="product-tile"] img[src], [data-testid="product-tile"] img[srcset]'
+  ).length;
+  return tiles > 0 && images >= Math.min(3, tiles);
+}
+"""
+
+_TILE_FIELDS_JS = """
+tiles => tiles.map(tile => {
+  const link = tile.querySelector('a[href^="/p/"]') || tile.querySelector('a[href]');
+  const img = tile.querySelector('img[alt]') || tile.querySelector('img');
+  const priceEl = tile.querySelector('[data-testid="pulse-product-price"]');
+  // A dedicated brand element avoids innerText, which lays out the whole tile; the
+  // first rendered line is the fallback.
+  const brandEl = tile.querySelector('[data-testid*="brand" i], [class*="brand" i]');
+  let brand = brandEl ? brandEl.textContent.trim() : '';
+  if (!brand) {
+    brand = tile.innerText.split('\\n').map(s => s.trim()).find(s => s && s !== '*') || '';
+  }
+  return {
+    href: link ? link.getAttribute('href') : null,
+    title: link ? link.getAttribute('title') : null,
+    aria: link ? link.getAttribute('aria-label') : null,
+    alt: img ? img.getAttribute('alt') : null,
+    src: img ? img.getAttribute('src') : null,
+    dataSrc: img ? img.getAttribute('data-src') : null,
+    srcset: img ? img.getAttribute('srcset') : null,
+    dataSrcset: img ? img.getAttribute('data-srcset') : null,
+    brand: brand || null,
+    priceText: priceEl ? priceEl.innerText : null,
+  };
+})
+"""
 
 
 class IntersportScraper(BaseScraper):
@@ -20,23 +67,24 @@ class IntersportScraper(BaseScraper):
     display_name = "Intersport"
     url = "https://www.intersport.de/d/marken/blackroll"
 
+    user_agent = (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+    )
+    locale = "de-DE"
+    viewport = {"width": 1920, "height": 1080}
+    # Only image URLs are read from the page; the files themselves are fetched over httpx.
+    block_resources = DEFAULT_BLOCKED_RESOURCES | {"image"}
+
     async def scrape(self) -> ScrapeResult:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-sandbox",
-                ],
-            )
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                locale="de-DE",
-                user_agent=(
-                    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                    "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-                ),
-            )
+        async with get_browser_context(
+            user_agent=self.user_agent,
+            locale=self.locale,
+            viewport=self.viewport,
+            block_resources=self.block_resources,
+            # Saved cookies keep the consent decision between runs, so the banner is skipped
+            storage_state=DEFAULT_CACHE_DIR / "state" / f"{self.name}.json" if cache_enabled() else None,
+        ) as context:
             page = await context.new_page()
 
             print(f"[{self.name}] Loading {self.url}...")
@@ -48,130 +96,78 @@ class IntersportScraper(BaseScraper):
             products = await self.extract_products(page)
             print(f"[{self.name}] Extracted {len(products)} products")
 
-            await browser.close()
-
-            return ScrapeResult(
-                source=self.name,
-                source_url=self.url,
-                scraped_at=datetime.now(UTC),
-                products=products,
-            )
+        return ScrapeResult(
+            source=self.name,
+            source_url=self.url,
+            scraped_at=datetime.now(UTC),
+            products=products,
+        )
 
     @staticmethod
     def _pick_srcset_url(srcset: str | None) -> str | None:
         if not srcset:
             return None
-        # srcset candidates are comma+whitespace separated; URLs themselves may contain commas.
-        candidates = [c.strip() for c in re.split(r",\\s+", srcset.strip()) if c.strip()]
-        if not candidates:
-            return None
-        return candidates[-1].split()[0]
+        # Only the last (largest) candidate is wanted. Candidates are separated by a comma
+        # plus whitespace while URLs may contain bare commas, so cut at the last ", ".
+        srcset = srcset.strip().rstrip(",").rstrip()
+        last = srcset[srcset.rfind(", ") + 1 :].strip()
+        return last.split(maxsplit=1)[0] if last else None
 
     async def _handle_cookie_consent(self, page: Page) -> None:
-        for selector in [
-            'button:has-text("Alle akzeptieren")',
-            'button:has-text("Akzeptieren")',
-            "#onetrust-accept-btn-handler",
-            '[data-testid="uc-accept-all-button"]',
-        ]:
-            try:
-                btn = await page.query_selector(selector)
-                if btn and await btn.is_visible():
-                    await btn.click()
-                    await page.wait_for_timeout(800)
-                    return
-            except Exception:
-                continue
+        if await click_first_visible(page, _CONSENT_SELECTORS, remember_as=self.name):
+            await page.wait_for_timeout(800)
 
     async def extract_products(self, page: Page) -> list[Product]:
-        products: list[Product] = []
-
         await self._handle_cookie_consent(page)
         await page.wait_for_selector('[data-testid="product-tile"]', timeout=60000, state="attached")
-        await page.wait_for_timeout(1500)
-
-        tiles = await page.query_selector_all('[data-testid="product-tile"]')
-        print(f"[{self.name}] Found {len(tiles)} product tiles")
+        try:
+            # Tiles attach before their images are hydrated; proceed as soon as a few have them.
+            await page.wait_for_function(_TILE_IMAGES_READY_JS, timeout=10000)
+        except Exception:
+            pass
+
+        # One round-trip for all tiles instead of ~10 per tile.
+        rows = await page.locator('[data-testid="product-tile"]').evaluate_all(_TILE_FIELDS_JS)
+        print(f"[{self.name}] Found {len(rows)} product tiles")
+
+        # Images are on a public CDN; the shared client keeps its connections warm across runs.
+        return await self.build_products(shared_client(), self.parse_rows(rows, self._parse_row))
+
+    def _parse_row(self, row: dict) -> dict | None:
+        href = row.get("href")
+        if not href:
+            return None
 
-        for idx, tile in enumerate(tiles):
-            try:
-                link = await tile.query_selector('a[href^="/p/"]') or await tile.query_selector("a[href]")
-                href = await link.get_attribute("href") if link else None
-                if not href:
-                    continue
-
-                url = urljoin("https://www.intersport.de", href)
-
-                img = await tile.query_selector("img[alt]") or await tile.query_selector("img")
-                name = None
-                if img:
-                    alt = await img.get_attribute("alt")
-                    if alt:
-                        name = alt.strip()
-                if not name and link:
-                    name = (await link.get_attribute("title")) or None
-                if not name and link:
-                    aria = await link.get_attribute("aria-label")
-                    if aria and "von " in aria:
-                        name = aria.split("von ", 1)[-1].strip()
-
-                lines = [ln.strip() for ln in (await tile.inner_text()).splitlines() if ln.strip() and ln.strip() != "*"]
-                brand = lines[0] if lines else None
-                if brand and name and brand.lower() not in name.lower():
-                    name = f"{brand} {name}"
-
-                price_text = None
-                if price_el := await tile.query_selector('[data-testid="pulse-product-price"]'):
-                    price_text = (await price_el.inner_text()).strip()
-                price, currency = parse_price(price_text)
-
-                item_id = None
-                try:
-                    parsed = urlparse(url)
-                    item_id = parse_qs(parsed.query).get("articleId", [None])[0]
-                except Exception:
-                    item_id = None
-
-                image_bytes = None
-                image_mime = None
-                image_url = None
-
-                if img:
-                    image_url = (
-                        await img.get_attribute("src")
-                        or await img.get_attribute("data-src")
-                        or self._pick_srcset_url(await img.get_attribute("srcset"))
-                        or self._pick_srcset_url(await img.get_attribute("data-srcset"))
-                    )
-
-                if image_url:
-                    image_url = urljoin("https://www.intersport.de", image_url)
-                    try:
-                        resp = await page.context.request.get(image_url, timeout=30000)
-                        if resp.ok:
-                            body = await resp.body()
-                            if len(body) >= 800:
-                                image_bytes = body
-                                image_mime = resp.headers.get("content-type")
-                                if image_mime and ";" in image_mime:
-                                    image_mime = image_mime.split(";", 1)[0].strip()
-                    except Exception as img_err:
-                        print(f"[{self.name}] Failed to fetch image for tile {idx}: {img_err}")
-
-                if name:
-                    products.append(
-                        Product(
-                            name=name,
-                            price=price,
-                            currency=currency,
-                            url=url,
-                            item_id=item_id,
-                            image=image_bytes,
-                            image_mime=image_mime,
-                        )
-                    )
+        url = urljoin("https://www.intersport.de", href)
 
-            except Exception as e:
-                print(f"[{self.name}] Error extracting product {idx}: {e}")
+        name = (row.get("alt") or "").strip() or None
+        if not name:
+            name = row.get("title") or None
+        if not name:
+            aria = row.get("aria")
+            if aria and "von " in aria:
+                name = aria.split("von ", 1)[-1].strip()
+        if not name:
+            return None
 
-        return products
+        brand = row.get("brand")
+        if brand and brand.lower() not in name.lower():
+            name = f"{brand} {name}"
+
+        price_text = (row.get("priceText") or "").strip() or None
+        price, currency = parse_price(price_text)
+
+        image_url = (
+            row.get("src")
+            or row.get("dataSrc")
+            or self._pick_srcset_url(row.get("srcset"))
+            or self._pick_srcset_url(row.get("dataSrcset"))
+        )
+        return {
+            "name": name,
+            "price": price,
+            "currency": currency,
+            "url": url,
+            "item_id": parse_qs(urlparse(url).query).get("articleId", [None])[0],
+            "image_url": urljoin("https://www.intersport.de", image_url) if image_url else None,
+        }
@@ -1,35 +1,135 @@
 """Scraper for Kaufland.de Blackroll products."""
 
-import random
 import re
 from datetime import datetime, UTC
 
-import cloudscraper
-from bs4 import BeautifulSoup
-from playwright.async_api import Page, async_playwright
+from curl_cffi.requests import AsyncSession
+import lxml.html
+from lxml import etree
+from playwright.async_api import Page
 from playwright_stealth import Stealth
 
 from ..models import Product, ScrapeResult
 from ..utils import parse_price
-from .base import BaseScraper
+from .base import BaseScraper, click_first_visible
+from .browser_pool import DEFAULT_BLOCKED_RESOURCES, get_browser_context
+from .http_cache import DEFAULT_CACHE_DIR, cache_enabled
+
+_ITEM_ID_RE = re.compile(r"/(\d{6,})(?:\?|$|/|#|\.)")
+
+_CONSENT_SELECTORS = (
+    'button#onetrust-accept-btn-handler',
+    'button:has-text("Alle akzeptieren")',
+    'button:has-text("Alle Cookies akzeptieren")',
+    '[data-testid="accept-all-button"]',
+    'button[class*="accept"]',
+)
+
+
+def _class_xpath(class_name: str) -> str:
+    """XPath step matching descendants carrying `class_name` (CSS `.class_name`)."""
+    return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+# Fallback chains for `_parse_html`, most specific first; compiled once. Per-tile ones
+# are evaluated relative to the tile.
+_TILE_XPATHS = (
+    etree.XPath('//article[@data-t="product-tile"]'),
+    etree.XPath('//*[@data-t="product-tile"]'),
+    etree.XPath(_class_xpath("product-tile")),
+)
+_LINK_XPATHS = (
+    etree.XPath('.//a[contains(@href, "/product/")]'),
+    etree.XPath(".//a[@href]"),
+)
+_NAME_XPATHS = (
+    etree.XPath('.//*[@data-t="product-title"]'),
+    etree.XPath("." + _class_xpath("product-tile__title")),
+    etree.XPath(".//h3"),
+)
+_PRICE_XPATHS = (
+    etree.XPath('.//*[@data-t="product-price"]'),
+    etree.XPath("." + _class_xpath("product-tile__price")),
+    etree.XPath('.//*[contains(@class, "price")]'),
+)
+
+
+def _first_match(xpaths: tuple[etree.XPath, ...], el: lxml.html.HtmlElement, *, all_hits: bool = False):
+    """First element (or, with `all_hits`, all elements) of the first XPath in the chain that matches."""
+    for xpath in xpaths:
+        if hits := xpath(el):
+            return hits if all_hits else hits[0]
+    return [] if all_hits else None
+
+
+def _text(el: lxml.html.HtmlElement) -> str:
+    # Same as BeautifulSoup's get_text(strip=True): stripped text nodes joined without separator.
+    return "".join(t.strip() for t in el.itertext())
+
+
+# Browser-side counterpart of `_TILE_XPATHS`, most specific first; passed into the JS below.
+_TILE_SELECTORS = ['article[data-t="product-tile"]', '[data-t="product-tile"]', ".product-tile"]
+_TILE_SELECTOR = ", ".join(_TILE_SELECTORS)
+
+# Resolves once the listing, Cloudflare's block page or its challenge has rendered.
+_PAGE_SETTLED_JS = """
+tileSelector => !!document.querySelector(tileSelector)
+  || /Zugriff blockiert|Verifizierung erforderlich/.test(document.body ? document.body.innerText : '')
+"""
+
+# Reads every product tile in one round-trip; mirrors the selector fallbacks of `_parse_html`.
+_TILE_FIELDS_JS = """
+tileSelectors => {
+  let tiles = [];
+  for (const selector of tileSelectors) {
+    tiles = document.querySelectorAll(selector);
+    if (tiles.length) break;
+  }
+  return Array.from(tiles).map(el => {
+    const link = el.querySelector('a[href*="/product/"]') || el.querySelector('a[href]');
+    if (!link) return {};
+    let name = link.getAttribute('title');
+    if (!name) {
+      const nameEl = el.querySelector('[data-t="product-title"]')
+        || el.querySelector('.product-tile__title')
+        || el.querySelector('h3');
+      name = nameEl ? nameEl.innerText : null;
+    }
+    const priceEl = el.querySelector('[data-t="product-price"]')
+      || el.querySelector('.product-tile__price')
+      || el.querySelector('[class*="price"]');
+    return {
+      href: link.getAttribute('href'),
+      name: name,
+      priceText: priceEl ? priceEl.innerText : null,
+    };
+  });
+}
+"""
 
 
 class KauflandScraper(BaseScraper):
     """Scrape Blackroll products from Kaufland.de.
 
-    Uses cloudscraper to bypass Cloudflare protection, with Playwright as fallback.
+    Fetches the listing with curl_cffi impersonating Chrome (Cloudflare fingerprints the
+    TLS handshake), with Playwright as fallback.
     """
 
     name = "kaufland"
     display_name = "Kaufland"
     url = "https://www.kaufland.de/s/?21=793090&search_value=blackroll"
 
+    locale = "de-DE"
+    viewport = {"width": 1920, "height": 1080}
+    # Product images are not collected from Kaufland.
+    block_resources = DEFAULT_BLOCKED_RESOURCES | {"image"}
+
     async def scrape(self) -> ScrapeResult:
-        """Run the scraper, trying cloudscraper first then Playwright fallback."""
-        # Try cloudscraper first (handles Cloudflare JS challenges)
-        products = self._scrape_with_cloudscraper()
+        """Run the scraper, trying a plain HTTP fetch first then Playwright fallback."""
+        # Try the impersonated HTTP request first (passes Cloudflare's fingerprint checks)
+        products = await self._scrape_http()
         if products:
-            print(f"[{self.name}] Successfully scraped {len(products)} products with cloudscraper")
+            print(f"[{self.name}] Successfully scraped {len(products)} products over HTTP")
             return ScrapeResult(
                 source=self.name,
                 source_url=self.url,
@@ -37,99 +137,60 @@ class KauflandScraper(BaseScraper):
                 products=products,
             )
 
-        # Fall back to Playwright if cloudscraper fails
-        print(f"[{self.name}] Cloudscraper failed, trying Playwright...")
+        # Fall back to Playwright if the HTTP fetch fails
+        print(f"[{self.name}] HTTP fetch failed, trying Playwright...")
         return await self._scrape_with_playwright()
 
-    def _scrape_with_cloudscraper(self) -> list[Product]:
-        """Try to scrape using cloudscraper to bypass Cloudflare."""
-        import time
-
-        # Try different browser configurations
-        browser_configs = [
-            {'browser': 'chrome', 'platform': 'linux', 'desktop': True},
-            {'browser': 'chrome', 'platform': 'windows', 'desktop': True},
-            {'browser': 'firefox', 'platform': 'linux', 'desktop': True},
-            {'browser': 'firefox', 'platform': 'windows', 'desktop': True},
-        ]
-
-        for config in browser_configs:
-            try:
-                scraper = cloudscraper.create_scraper(
-                    browser=config,
-                    delay=10,
-                    interpreter='js2py',  # Use js2py interpreter for JS challenges
-                )
-
-                print(f"[{self.name}] Trying cloudscraper with {config['browser']}/{config['platform']}...")
-                response = scraper.get(
+    async def _scrape_http(self) -> list[Product]:
+        """Fetch the listing with Chrome's TLS/HTTP2 fingerprint and parse it; [] if blocked."""
+        try:
+            # The impersonation supplies matching User-Agent/Sec-Ch-Ua headers itself.
+            async with AsyncSession(impersonate="chrome") as session:
+                response = await session.get(
                     self.url,
-                    headers={
-                        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                        'Accept-Language': 'de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7',
-                        'Accept-Encoding': 'gzip, deflate, br',
-                        'Cache-Control': 'max-age=0',
-                        'Sec-Ch-Ua': '"Chromium";v="130", "Google Chrome";v="130", "Not?A_Brand";v="99"',
-                        'Sec-Ch-Ua-Mobile': '?0',
-                        'Sec-Ch-Ua-Platform': '"Linux"',
-                        'Sec-Fetch-Dest': 'document',
-                        'Sec-Fetch-Mode': 'navigate',
-                        'Sec-Fetch-Site': 'none',
-                        'Sec-Fetch-User': '?1',
-                        'Upgrade-Insecure-Requests': '1',
-                    },
+                    headers={'Accept-Language': 'de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7'},
                     timeout=30,
                 )
-
-                if response.status_code == 200:
-                    # Check if we got blocked
-                    if "Zugriff blockiert" in response.text or "Access denied" in response.text:
-                        print(f"[{self.name}] Cloudscraper was blocked by Cloudflare")
-                        continue
-
-                    # Check if we got a Cloudflare challenge page
-                    if "challenge-platform" in response.text or "cf-browser-verification" in response.text:
-                        print(f"[{self.name}] Cloudscraper hit Cloudflare challenge page")
-                        continue
-
-                    print(f"[{self.name}] Cloudscraper got page successfully, parsing...")
-                    products = self._parse_html(response.text)
-                    if products:
-                        return products
-                    print(f"[{self.name}] No products found in HTML, trying next config...")
-                else:
-                    print(f"[{self.name}] Cloudscraper got status {response.status_code}")
-
-                time.sleep(2)  # Brief delay between attempts
-
-            except cloudscraper.exceptions.CloudflareChallengeError as e:
-                print(f"[{self.name}] Cloudflare challenge failed: {e}")
-            except Exception as e:
-                print(f"[{self.name}] Cloudscraper error: {e}")
-
-        return []
+        except Exception as e:
+            print(f"[{self.name}] HTTP fetch error: {e}")
+            return []
+
+        if response.status_code != 200:
+            print(f"[{self.name}] HTTP fetch got status {response.status_code}")
+            return []
+
+        html = response.text
+        # Check if we got blocked
+        if "Zugriff blockiert" in html or "Access denied" in html:
+            print(f"[{self.name}] HTTP fetch was blocked by Cloudflare")
+            return []
+
+        # Check if we got a Cloudflare challenge page
+        if "challenge-platform" in html or "cf-browser-verification" in html:
+            print(f"[{self.name}] HTTP fetch hit Cloudflare challenge page")
+            return []
+
+        print(f"[{self.name}] Got page over HTTP, parsing...")
+        products = self._parse_html(html)
+        if not products:
+            print(f"[{self.name}] No products found in HTML")
+        return products
 
     def _parse_html(self, html: str) -> list[Product]:
-        """Parse product data from HTML using BeautifulSoup."""
+        """Parse product data from HTML using lxml with precompiled XPath selectors."""
         products: list[Product] = []
-        soup = BeautifulSoup(html, 'lxml')
+        tree = lxml.html.fromstring(html)
 
         # Find product tiles
-        product_elements = soup.select('article[data-t="product-tile"]')
-        if not product_elements:
-            product_elements = soup.select('[data-t="product-tile"]')
-        if not product_elements:
-            product_elements = soup.select('.product-tile')
+        product_elements = _first_match(_TILE_XPATHS, tree, all_hits=True)
 
         print(f"[{self.name}] Found {len(product_elements)} product elements in HTML")
 
         for idx, element in enumerate(product_elements):
             try:
                 # Get product link
-                link = element.select_one('a[href*="/product/"]')
-                if not link:
-                    link = element.select_one('a[href]')
-                if not link:
+                link = _first_match(_LINK_XPATHS, element)
+                if link is None:
                     continue
 
                 # Get URL
@@ -140,13 +201,9 @@ class KauflandScraper(BaseScraper):
                 # Get product name
                 name = link.get('title')
                 if not name:
-                    name_el = element.select_one('[data-t="product-title"]')
-                    if not name_el:
-                        name_el = element.select_one('.product-tile__title')
-                    if not name_el:
-                        name_el = element.select_one('h3')
-                    if name_el:
-                        name = name_el.get_text(strip=True)
+                    name_el = _first_match(_NAME_XPATHS, element)
+                    if name_el is not None:
+                        name = _text(name_el)
 
                 if not name:
                     continue
@@ -156,20 +213,15 @@ class KauflandScraper(BaseScraper):
                 # Extract item_id from URL
                 item_id = None
                 if url:
-                    if match := re.search(r'/(\d{6,})(?:\?|$|/|#|\.)', url):
+                    if match := _ITEM_ID_RE.search(url):
                         item_id = match.group(1)
 
                 # Get price
                 price = None
                 currency = None
-                price_el = element.select_one('[data-t="product-price"]')
-                if not price_el:
-                    price_el = element.select_one('.product-tile__price')
-                if not price_el:
-                    price_el = element.select_one('[class*="price"]')
-                if price_el:
-                    price_text = price_el.get_text(strip=True)
-                    price, currency = parse_price(price_text)
+                price_el = _first_match(_PRICE_XPATHS, element)
+                if price_el is not None:
+                    price, currency = parse_price(_text(price_el))
 
                 products.append(Product(
                     name=name,
@@ -187,19 +239,14 @@ class KauflandScraper(BaseScraper):
 
     async def _scrape_with_playwright(self) -> ScrapeResult:
         """Run the scraper with Kaufland-specific handling."""
-        async with async_playwright() as p:
-            # Use Chromium with stealth mode for anti-bot bypass
-            browser = await p.chromium.launch(
-                headless=True,
-                args=[
-                    "--disable-blink-features=AutomationControlled",
-                    "--no-sandbox",
-                ],
-            )
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                locale="de-DE",
-            )
+        # Shared Chromium with stealth mode for anti-bot bypass
+        async with get_browser_context(
+            locale=self.locale,
+            viewport=self.viewport,
+            block_resources=self.block_resources,
+            # Saved cookies keep the consent decision (and any Cloudflare clearance) between runs
+            storage_state=DEFAULT_CACHE_DIR / "state" / f"{self.name}.json" if cache_enabled() else None,
+        ) as context:
             page = await context.new_page()
             # Apply stealth mode to avoid bot detection
             stealth = Stealth()
@@ -211,15 +258,17 @@ class KauflandScraper(BaseScraper):
             except Exception as e:
                 print(f"[{self.name}] Initial load error: {e}, continuing...")
 
-            # Wait for potential Cloudflare challenge to resolve
-            await page.wait_for_timeout(5000)
+            # Wait for the listing, a block page or a challenge instead of a fixed delay
+            try:
+                await page.wait_for_function(_PAGE_SETTLED_JS, arg=_TILE_SELECTOR, timeout=15000)
+            except Exception:
+                pass
 
             # Check if we hit Cloudflare block or challenge
             page_content = await page.content()
             if "Zugriff blockiert" in page_content:
                 print(f"[{self.name}] ERROR: Cloudflare blocked access (IP blocked)")
                 print(f"[{self.name}] Try using a residential proxy or different IP")
-                await browser.close()
                 return ScrapeResult(
                     source=self.name,
                     source_url=self.url,
@@ -232,19 +281,19 @@ class KauflandScraper(BaseScraper):
                 cf_checkbox = await page.query_selector('input[type="checkbox"]')
                 if cf_checkbox:
                     await cf_checkbox.click()
-                    await page.wait_for_timeout(5000)
 
             # Handle cookie consent banner
             await self._handle_cookie_consent(page)
 
-            # Wait for products to load with human-like delay
-            await page.wait_for_timeout(2000 + random.randint(0, 1000))
+            # Wait for products to load
+            try:
+                await page.wait_for_selector(_TILE_SELECTOR, state="visible", timeout=20000)
+            except Exception as e:
+                print(f"[{self.name}] Product tiles did not appear: {e}")
 
             products = await self.extract_products(page)
             print(f"[{self.name}] Extracted {len(products)} products")
 
-            await browser.close()
-
         return ScrapeResult(
             source=self.name,
             source_url=self.url,
@@ -254,65 +303,30 @@ class KauflandScraper(BaseScraper):
 
     async def _handle_cookie_consent(self, page: Page) -> None:
         """Handle Kaufland cookie consent banner if present."""
-        for selector in [
-            'button#onetrust-accept-btn-handler',
-            'button:has-text("Alle akzeptieren")',
-            'button:has-text("Alle Cookies akzeptieren")',
-            '[data-testid="accept-all-button"]',
-            'button[class*="accept"]',
-        ]:
-            try:
-                btn = await page.query_selector(selector)
-                if btn and await btn.is_visible():
-                    print(f"[{self.name}] Accepting cookies...")
-                    await btn.click()
-                    await page.wait_for_timeout(1000)
-                    return
-            except Exception:
-                continue
+        if await click_first_visible(page, _CONSENT_SELECTORS, remember_as=self.name):
+            print(f"[{self.name}] Accepted cookies")
+            await page.wait_for_timeout(1000)
 
     async def extract_products(self, page: Page) -> list[Product]:
         """Extract all Blackroll products from the search results."""
         products: list[Product] = []
 
-        # Wait for product grid to load
-        await page.wait_for_timeout(2000)
-
-        # Kaufland uses product-tile or article elements for product cards
-        product_elements = await page.query_selector_all('article[data-t="product-tile"]')
-        if not product_elements:
-            # Fallback selectors
-            product_elements = await page.query_selector_all('[data-t="product-tile"]')
-        if not product_elements:
-            product_elements = await page.query_selector_all('.product-tile')
+        # One round-trip for all tiles instead of several per tile.
+        rows = await page.evaluate(_TILE_FIELDS_JS, _TILE_SELECTORS)
 
-        print(f"[{self.name}] Found {len(product_elements)} product elements")
+        print(f"[{self.name}] Found {len(rows)} product elements")
 
-        for idx, element in enumerate(product_elements):
+        for idx, row in enumerate(rows):
             try:
-                # Get product link
-                link = await element.query_selector('a[href*="/product/"]')
-                if not link:
-                    link = await element.query_selector('a[href]')
-                if not link:
-                    continue
-
                 # Get URL
-                url = await link.get_attribute("href")
-                if url and not url.startswith("http"):
+                url = row.get("href")
+                if not url:
+                    continue
+                if not url.startswith("http"):
                     url = f"https://www.kaufland.de{url}"
 
                 # Get product name from title attribute or text content
-                name = await link.get_attribute("title")
-                if not name:
-                    name_el = await element.query_selector('[data-t="product-title"]')
-                    if not name_el:
-                        name_el = await element.query_selector('.product-tile__title')
-                    if not name_el:
-                        name_el = await element.query_selector('h3')
-                    if name_el:
-                        name = await name_el.inner_text()
-
+                name = row.get("name")
                 if not name:
                     continue
 
@@ -320,21 +334,11 @@ class KauflandScraper(BaseScraper):
 
                 # Extract item_id from URL
                 item_id = None
-                if url:
-                    if match := re.search(r'/(\d{6,})(?:\?|$|/|#|\.)', url):
-                        item_id = match.group(1)
+                if match := _ITEM_ID_RE.search(url):
+                    item_id = match.group(1)
 
                 # Get price
-                price = None
-                currency = None
-                price_el = await element.query_selector('[data-t="product-price"]')
-                if not price_el:
-                    price_el = await element.query_selector('.product-tile__price')
-                if not price_el:
-                    price_el = await element.query_selector('[class*="price"]')
-                if price_el:
-                    price_text = await price_el.inner_text()
-                    price, currency = parse_price(price_text)
+                price, currency = parse_price(row.get("priceText"))
 
                 products.append(Product(
                     name=name,
@@ -2,11 +2,12 @@
 
 from datetime import datetime, UTC
 
-from playwright.async_api import Page, async_playwright
+from playwright.async_api import Page
 
 from ..models import Product, ScrapeResult
 from ..utils import parse_price
 from .base import BaseScraper
+from .browser_pool import get_browser_context
 
 
 class SportscheckScraper(BaseScraper):
@@ -18,9 +19,8 @@ class SportscheckScraper(BaseScraper):
 
     async def scrape(self) -> ScrapeResult:
         """Run the scraper with custom handling for Sportscheck."""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        async with get_browser_context() as context:
+            page = await context.new_page()
 
             print(f"[{self.name}] Loading {self.url}...")
             await page.goto(self.url, wait_until="domcontentloaded", timeout=60000)
@@ -40,8 +40,6 @@ class SportscheckScraper(BaseScraper):
             products = await self.extract_products(page)
             print(f"[{self.name}] Extracted {len(products)} products")
 
-            await browser.close()
-
         return ScrapeResult(
             source=self.name,
             source_url=self.url,
@@ -13,6 +13,26 @@ from ..utils import parse_price
 from .base import BaseScraper
 from .browser_pool import get_browser_context
 
+# [brand, name, price text, href, img src, img srcset] for one product card.
+_CARD_FIELDS_JS = """
+el => {
+  const text = sel => {
+    const found = el.querySelector(sel);
+    return found ? found.innerText : null;
+  };
+  const link = el.querySelector('a.ProductCard--link');
+  const img = el.querySelector('.ProductCard--imageWrapper img, .ProductCard--image img, img');
+  return [
+    text('.ProductCard--brand'),
+    text('.ProductCard--name'),
+    text('.ProductPrice--current') ?? text('.ProductCard--prices'),
+    link ? link.getAttribute('href') : null,
+    img ? img.getAttribute('src') : null,
+    img ? img.getAttribute('srcset') : null,
+  ];
+}
+"""
+
 
 class TransaScraper(BaseScraper):
     """Scrape Blackroll products from Transa.ch."""
@@ -118,24 +138,17 @@ class TransaScraper(BaseScraper):
                 await el.scroll_into_view_if_needed()
                 await page.wait_for_timeout(100)
 
-                brand_el = await el.query_selector(".ProductCard--brand")
-                brand = (await brand_el.inner_text()).strip() if brand_el else None
+                # All fields of the card in one round-trip instead of one per selector/attribute.
+                brand, name, price_text, url, src, srcset = await el.evaluate(_CARD_FIELDS_JS)
 
-                name_el = await el.query_selector(".ProductCard--name")
-                name = (await name_el.inner_text()).strip() if name_el else None
+                brand = (brand or "").strip() or None
+                name = (name or "").strip() or None
                 if brand and name and brand.lower() not in name.lower():
                     name = f"{brand} {name}"
 
-                price_el = await el.query_selector(".ProductPrice--current")
-                if not price_el:
-                    price_el = await el.query_selector(".ProductCard--prices")
-                price_text = (await price_el.inner_text()).strip() if price_el else None
+                price_text = (price_text or "").strip() or None
                 price, currency = parse_price(price_text)
 
-                url = None
-                link_el = await el.query_selector("a.ProductCard--link")
-                if link_el:
-                    url = await link_el.get_attribute("href")
                 if url:
                     url = urljoin("https://www.transa.ch", url)
 
@@ -143,12 +156,7 @@ class TransaScraper(BaseScraper):
 
                 image_bytes = None
                 image_mime = None
-                image_url = None
-                img_el = await el.query_selector(".ProductCard--imageWrapper img, .ProductCard--image img, img")
-                if img_el:
-                    src = await img_el.get_attribute("src")
-                    srcset = await img_el.get_attribute("srcset")
-                    image_url = self._pick_image_url(src, srcset)
+                image_url = self._pick_image_url(src, srcset)
 
                 if image_url:
                     image_url = urljoin("https://www.transa.ch", image_url)
@@ -0,0 +1,68 @@
+"""URL helpers shared by scrapers."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Mapping
+from urllib.parse import SplitResult, parse_qsl, urljoin, urlsplit
+
+
+@lru_cache(maxsize=64)
+def _split_base(base: str) -> SplitResult:
+    return urlsplit(base)
+
+
+def normalize(raw: str | None, *, base: str) -> str | None:
+    """Turn a scraped href/src into an absolute URL relative to `base`.
+
+    Handles protocol-relative (`//host/...`) and root-relative (`/path`) values
+    without re-splitting `base` for every call; anything else falls back to `urljoin`.
+    """
+    if not raw or not isinstance(raw, str):
+        return None
+    url = raw.strip()
+    if not url:
+        return None
+    if url.startswith(("https://", "http://")):
+        return url
+    parts = _split_base(base)
+    if url.startswith("//"):
+        return f"{parts.scheme or 'https'}:{url}"
+    if url.startswith("/"):
+        return f"{parts.scheme}://{parts.netloc}{url}"
+    return urljoin(base, url)
+
+
+def is_avif(url: str | None) -> bool:
+    """Whether `url` explicitly points at an AVIF image (by extension or format query param).
+
+    Pillow cannot reliably decode AVIF here, so such images are not worth downloading.
+    """
+    if not url:
+        return False
+    parts = urlsplit(url)
+    if parts.path.lower().endswith(".avif"):
+        return True
+    return any(k in {"format", "fm"} and v.lower() == "avif" for k, v in parse_qsl(parts.query))
+
+
+def first_srcset_url(value: str | None) -> str | None:
+    """URL of the first candidate of a srcset-style value (a plain URL is returned as is)."""
+    if not value or not (value := value.strip()):
+        return None
+    if "," in value:
+        value = value.split(",", 1)[0]
+    return value.split(maxsplit=1)[0] if value.strip() else None
+
+
+def lazy_image_src(attrs: Mapping[str, str] | None) -> str | None:
+    """First real image source among an <img>'s src/data-src/data-srcset/srcset attributes.
+
+    Lazy-loading markup keeps a data: placeholder in src until the image scrolls into view.
+    """
+    if attrs is None:
+        return None
+    for attr in ("src", "data-src", "data-srcset", "srcset"):
+        if (value := attrs.get(attr)) and not value.startswith("data:"):
+            return value
+    return None
@@ -1,6 +1,7 @@
 """Shared utilities for scrapers."""
 
 import re
+from functools import lru_cache
 
 CURRENCY_MAP = {
     "€": "EUR",
@@ -13,7 +14,12 @@ CURRENCY_MAP = {
     "gbp": "GBP",
 }
 
+_PRICE_PREFIX_RE = re.compile(r"^(ab|from|uvp|statt)\s+")
+_PRICE_NUMBER_RE = re.compile(r"[\d][\d\s.,]*")
 
+
+# Pure and called once per product; identical price strings recur across tiles and runs.
+@lru_cache(maxsize=4096)
 def parse_price(price_text: str | None) -> tuple[float | None, str | None]:
     """Parse price text into (amount, currency).
 
@@ -37,10 +43,10 @@ def parse_price(price_text: str | None) -> tuple[float | None, str | None]:
             break
 
     # Remove common prefixes
-    text = re.sub(r"^(ab|from|uvp|statt)\s+", "", text.strip())
+    text = _PRICE_PREFIX_RE.sub("", text.strip())
 
     # Extract numeric chunk and normalize thousands/decimal separators.
-    if not (match := re.search(r"[\d][\d\s.,]*", text)):
+    if not (match := _PRICE_NUMBER_RE.search(text)):
         return None, currency
 
     num = match.group(0).replace(" ", "").replace("\xa0", "")
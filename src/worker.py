@@ -14,6 +14,7 @@ from .db import ProductDatabase
 from .job_queue import JobQueue
 from .scrapers import get_scraper
 from .scrapers.browser_pool import BrowserPool
+from .scrapers.http_client import close_shared_client
 from .scrapers.amazon import scrape_amazon_listing
 from .models import ScrapeResult
 
@@ -47,6 +48,8 @@ class Worker:
         self.worker_id = f"worker-{uuid.uuid4().hex[:8]}"
         self._running = False
         self._running_jobs: dict[int, asyncio.Task] = {}
+        # One save at a time: concurrent sqlite writers otherwise fail with "database is locked".
+        self._save_lock = asyncio.Lock()
 
     async def start(self) -> None:
         """Start the worker loop."""
@@ -69,8 +72,9 @@ class Worker:
                 await stale_task
             except asyncio.CancelledError:
                 pass
-            # Cleanup browser pool on shutdown
+            # Cleanup browser pool and pooled HTTP connections on shutdown
             await BrowserPool.shutdown()
+            await close_shared_client()
             logger.info(f"Worker {self.worker_id} stopped")
 
     async def _run_loop(self) -> None:
@@ -142,8 +146,7 @@ class Worker:
                 logger.warning(f"Job {job_id} failed: {error_msg}")
                 return
 
-            # Save results to database
-            self.db.save_results(result)
+            await self._save_results(result)
 
             # Auto-link Amazon storefront products to canonicals (high confidence only).
             if scraper_name.startswith("amazon"):
@@ -192,7 +195,7 @@ class Worker:
                             # Avoid redundant save for storefront source if already updated there.
                             if src == result.source and asin in scraped_asins and src != "amazon":
                                 continue
-                            self.db.save_results(
+                            await self._save_results(
                                 ScrapeResult(
                                     source=src,
                                     source_url=prod.url or f"https://www.amazon.de/dp/{asin}",
@@ -208,7 +211,7 @@ class Worker:
                                             image_mime=prod.image_mime,
                                         )
                                     ],
-                                )
+                                ),
                             )
                 except Exception as refresh_err:
                     logger.warning(f"Amazon tracked-ASIN refresh failed: {refresh_err}")
@@ -235,6 +238,15 @@ class Worker:
 
             logger.error(f"Job {job_id} failed: {error_msg}")
 
+    async def _save_results(self, result: ScrapeResult) -> None:
+        """Save results to the database, one save at a time.
+
+        Saving re-encodes every image to WebP, which is CPU-bound, so it runs off the
+        event loop to keep concurrent jobs scraping.
+        """
+        async with self._save_lock:
+            await asyncio.to_thread(self.db.save_results, result)
+
     async def _stale_job_checker(self) -> None:
         """Periodically check for and reclaim stale jobs."""
         while self._running:
@@ -0,0 +1,41 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+class TestHttpCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_roundtrip_and_ttl(self):
+        from src.scrapers.http_cache import cache_get, cache_put
+
+        url = "https://r.jina.ai/https://example.com/listing"
+        self.assertIsNone(cache_get(url, ttl=600, cache_dir=self.cache_dir))
+
+        cache_put(url, b"listing", cache_dir=self.cache_dir)
+        self.assertEqual(cache_get(url, ttl=600, cache_dir=self.cache_dir), b"listing")
+
+        (entry,) = self.cache_dir.iterdir()
+        stale = time.time() - 601
+        os.utime(entry, (stale, stale))
+        self.assertIsNone(cache_get(url, ttl=600, cache_dir=self.cache_dir))
+
+    def test_disabled_via_env(self):
+        from src.scrapers.http_cache import cache_get, cache_put
+
+        url = "https://example.com/"
+        with mock.patch.dict(os.environ, {"CORASTUFF_NO_CACHE": "1"}):
+            cache_put(url, b"body", cache_dir=self.cache_dir)
+            self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+        cache_put(url, b"body", cache_dir=self.cache_dir)
+        with mock.patch.dict(os.environ, {"CORASTUFF_NO_CACHE": "1"}):
+            self.assertIsNone(cache_get(url, ttl=600, cache_dir=self.cache_dir))
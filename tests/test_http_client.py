@@ -0,0 +1,49 @@
+import asyncio
+import unittest
+
+
+class TestSharedClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        from src.scrapers.http_client import close_shared_client
+
+        await close_shared_client()
+
+    async def test_same_client_within_a_loop(self):
+        from src.scrapers.http_client import shared_client
+
+        self.assertIs(shared_client(), shared_client())
+
+    async def test_close_opens_a_fresh_client(self):
+        from src.scrapers.http_client import close_shared_client, shared_client
+
+        first = shared_client()
+        await close_shared_client()
+        self.assertTrue(first.is_closed)
+        self.assertIsNot(shared_client(), first)
+
+    async def test_cookies_are_not_stored(self):
+        import httpx
+
+        from src.scrapers.http_client import shared_client
+
+        client = shared_client()
+        response = httpx.Response(
+            200,
+            headers={"set-cookie": "session=abc; Path=/"},
+            request=httpx.Request("GET", "https://example.com/"),
+        )
+        client.cookies.extract_cookies(response)
+        self.assertEqual(len(client.cookies), 0)
+
+
+class TestSharedClientLoops(unittest.TestCase):
+    def test_new_event_loop_gets_new_client(self):
+        from src.scrapers.http_client import close_shared_client, shared_client
+
+        async def grab():
+            return shared_client()
+
+        first = asyncio.run(grab())
+        second = asyncio.run(grab())
+        self.assertIsNot(first, second)
+        asyncio.run(close_shared_client())
@@ -0,0 +1,174 @@
+import asyncio
+import unittest
+
+
+class TestImageCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        from src.scrapers import image_cache
+
+        image_cache.clear()
+
+    async def test_concurrent_requests_share_one_fetch(self):
+        from src.scrapers.image_cache import cached_fetch
+
+        calls: list[str] = []
+
+        async def fetcher(url: str):
+            calls.append(url)
+            await asyncio.sleep(0.01)
+            return b"x" * 1000, "image/jpeg"
+
+        url = "https://example.com/hero.jpg"
+        results = await asyncio.gather(*(cached_fetch(url, fetcher) for _ in range(5)))
+        self.assertEqual(calls, [url])
+        self.assertTrue(all(r == (b"x" * 1000, "image/jpeg") for r in results))
+
+        await cached_fetch(url, fetcher)
+        self.assertEqual(len(calls), 1)
+
+    async def test_failures_are_not_memoized(self):
+        from src.scrapers.image_cache import cached_fetch
+
+        calls = 0
+
+        async def fetcher(url: str):
+            nonlocal calls
+            calls += 1
+            return None, None
+
+        self.assertEqual(await cached_fetch("https://example.com/a.jpg", fetcher), (None, None))
+        self.assertEqual(await cached_fetch("https://example.com/a.jpg", fetcher), (None, None))
+        self.assertEqual(calls, 2)
+        self.assertEqual(await cached_fetch(None, fetcher), (None, None))
+        self.assertEqual(calls, 2)
+
+    async def test_memoized_results_expire(self):
+        from unittest import mock
+
+        from src.scrapers import image_cache
+
+        calls = 0
+
+        async def fetcher(url: str):
+            nonlocal calls
+            calls += 1
+            return b"x" * 1000, "image/jpeg"
+
+        url = "https://example.com/hero.jpg"
+        with mock.patch.object(image_cache.time, "monotonic", return_value=1000.0):
+            await image_cache.cached_fetch(url, fetcher)
+            await image_cache.cached_fetch(url, fetcher)
+        self.assertEqual(calls, 1)
+
+        with mock.patch.object(image_cache.time, "monotonic", return_value=1000.0 + image_cache.MAX_AGE + 1):
+            await image_cache.cached_fetch(url, fetcher)
+        self.assertEqual(calls, 2)
+
+
+class TestReadImageBody(unittest.IsolatedAsyncioTestCase):
+    async def _read(self, body: bytes, *, declare_length: bool, **limits):
+        import httpx
+
+        from src.scrapers.image_cache import read_image_body
+
+        async def chunks():
+            for i in range(0, len(body), 1024):
+                yield body[i : i + 1024]
+
+        def handler(request):
+            if declare_length:
+                return httpx.Response(200, content=body)
+            # A streamed body carries no Content-Length header.
+            return httpx.Response(200, content=chunks())
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            async with client.stream("GET", "https://example.com/a.jpg") as resp:
+                return await read_image_body(resp, **limits)
+
+    async def test_accepts_body_within_bounds(self):
+        body = b"x" * 5000
+        self.assertEqual(await self._read(body, declare_length=True), body)
+        self.assertEqual(await self._read(body, declare_length=False), body)
+
+    async def test_rejects_small_and_oversize_bodies(self):
+        for declare_length in (True, False):
+            self.assertIsNone(await self._read(b"x" * 100, declare_length=declare_length))
+            self.assertIsNone(await self._read(b"x" * 5000, declare_length=declare_length, max_bytes=4096))
+
+
+class TestSniffImageMime(unittest.TestCase):
+    def test_recognises_magic_bytes(self):
+        from src.scrapers.image_cache import sniff_image_mime
+
+        self.assertEqual(sniff_image_mime(b"\x89PNG\r\n\x1a\n" + b"\0" * 8), "image/png")
+        self.assertEqual(sniff_image_mime(b"\xff\xd8\xff\xe0" + b"\0" * 8), "image/jpeg")
+        self.assertEqual(sniff_image_mime(b"RIFF\x10\0\0\0WEBPVP8 "), "image/webp")
+        self.assertEqual(sniff_image_mime(b"GIF89a" + b"\0" * 8), "image/gif")
+
+    def test_unknown_or_empty_body(self):
+        from src.scrapers.image_cache import sniff_image_mime
+
+        self.assertIsNone(sniff_image_mime(b"<html></html>"))
+        self.assertIsNone(sniff_image_mime(b""))
+        self.assertIsNone(sniff_image_mime(None))
+
+
+class TestFetchImage(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        from src.scrapers import image_cache
+
+        image_cache.clear()
+
+    @staticmethod
+    def _client(routes: dict[str, tuple[int, str, bytes]], seen: list[str] | None = None):
+        import httpx
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if seen is not None:
+                seen.append(str(request.url))
+            status, content_type, body = routes[request.url.path]
+            return httpx.Response(status, headers={"content-type": content_type}, content=body)
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def test_prefers_sniffed_mime_and_drops_unwanted_types(self):
+        from src.scrapers.image_cache import fetch_image
+
+        png = b"\x89PNG\r\n\x1a\n" + b"\0" * 2000
+        routes = {
+            "/mislabelled.jpg": (200, "image/jpeg; charset=binary", png),
+            "/error.jpg": (200, "text/html", b"<html>" * 500),
+            "/missing.jpg": (404, "image/jpeg", png),
+            "/photo.avif": (200, "image/avif", b"\0" * 2000),
+        }
+        async with self._client(routes) as client:
+            self.assertEqual(await fetch_image(client, "https://cdn/mislabelled.jpg"), (png, "image/png"))
+            self.assertEqual(await fetch_image(client, "https://cdn/error.jpg"), (None, None))
+            self.assertEqual(await fetch_image(client, "https://cdn/missing.jpg"), (None, None))
+            self.assertEqual(
+                await fetch_image(client, "https://cdn/photo.avif", skip_mimes=frozenset({"image/avif"})),
+                (None, None),
+            )
+
+    async def test_fetch_images_keeps_order_and_dedupes(self):
+        from src.scrapers.image_cache import fetch_images
+
+        jpeg = b"\xff\xd8\xff\xe0" + b"\0" * 2000
+        seen: list[str] = []
+        async with self._client({"/a.jpg": (200, "image/jpeg", jpeg)}, seen) as client:
+            results = await fetch_images(client, ["https://cdn/a.jpg", None, "https://cdn/a.jpg"])
+        self.assertEqual(results, [(jpeg, "image/jpeg"), (None, None), (jpeg, "image/jpeg")])
+        self.assertEqual(seen, ["https://cdn/a.jpg"])
+
+    async def test_fetch_images_with_custom_fetcher(self):
+        from src.scrapers.image_cache import fetch_images
+
+        calls: list[str] = []
+
+        async def fetcher(url: str):
+            calls.append(url)
+            return b"x" * 1000, "image/png"
+
+        results = await fetch_images(None, ["https://cdn/b.png", "https://cdn/b.png"], fetcher=fetcher)
+        self.assertEqual(results, [(b"x" * 1000, "image/png")] * 2)
+        self.assertEqual(calls, ["https://cdn/b.png"])
@@ -0,0 +1,29 @@
+import unittest
+
+
+class TestPickSrcsetUrl(unittest.TestCase):
+    def pick(self, srcset):
+        from src.scrapers.intersport import IntersportScraper
+
+        return IntersportScraper._pick_srcset_url(srcset)
+
+    def test_returns_last_candidate(self):
+        self.assertEqual(self.pick("https://a/s.jpg 320w, https://a/m.jpg 640w, https://a/l.jpg 1280w"), "https://a/l.jpg")
+
+    def test_single_candidate_and_bare_url(self):
+        self.assertEqual(self.pick("https://a/only.jpg 2x"), "https://a/only.jpg")
+        self.assertEqual(self.pick(" https://a/only.jpg "), "https://a/only.jpg")
+
+    def test_commas_inside_urls_are_kept(self):
+        self.assertEqual(
+            self.pick("https://cdn/w_320,h_320/x.jpg 320w, https://cdn/w_640,h_640/x.jpg 640w"),
+            "https://cdn/w_640,h_640/x.jpg",
+        )
+
+    def test_empty_values(self):
+        self.assertIsNone(self.pick(None))
+        self.assertIsNone(self.pick(""))
+        self.assertIsNone(self.pick(" , "))
+
+    def test_trailing_separator(self):
+        self.assertEqual(self.pick("https://a/s.jpg 1x, https://a/l.jpg 2x, "), "https://a/l.jpg")
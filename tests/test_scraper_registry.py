@@ -26,3 +26,11 @@ class TestScraperRegistry(unittest.TestCase):
         scraper = get_scraper("otto")
         self.assertEqual(scraper.name, "otto")
 
+    def test_registered_scrapers_share_pooled_base(self):
+        from src.scrapers import SCRAPERS, BaseScraper
+        from src.scrapers import base, browser_pool
+
+        self.assertIs(BaseScraper, base.BaseScraper)
+        self.assertIs(base.get_browser_context, browser_pool.get_browser_context)
+        for name, cls in SCRAPERS.items():
+            self.assertTrue(issubclass(cls, base.BaseScraper), name)